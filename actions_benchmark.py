@@ -0,0 +1,44 @@
+import time
+from ludema.board import Board
+from ludema.pieces import Player, NPC
+
+"""
+Measures how much a move costs as a game goes on. Every move should cost
+the same on the first turn than after thousands of them, and every move
+of the player should pass exactly one turn.
+
+Run it with: python actions_benchmark.py [moves per window] [windows]
+"""
+
+
+def measure(piece, moves):
+    """Move piece up and down moves times, return the microseconds per move."""
+    up, down = piece.move.up, piece.move.down
+    start = time.perf_counter()
+    for _ in range(moves // 2):
+        up()
+        down()
+    return (time.perf_counter() - start) / moves * 1e6
+
+
+def main(moves=20000, windows=10):
+    board = Board("Benchmark", 10, 10, [lambda: False], [lambda: False])
+    player = Player("@", "Player")
+    npc = NPC("N", "NPC")
+    board.put_piece(player, 0, 0)
+    board.put_piece(npc, 9, 9)
+
+    print("{0:>8} {1:>14} {2:>14}".format("moves", "player us/move", "npc us/move"))
+    for window in range(1, windows + 1):
+        player_cost = measure(player, moves)
+        npc_cost = measure(npc, moves)
+        print("{0:>8} {1:>14.2f} {2:>14.2f}".format(window * moves, player_cost, npc_cost))
+
+    player_moves = windows * (moves // 2) * 2
+    assert board.turn == player_moves, "{0} turns for {1} moves".format(board.turn, player_moves)
+    print("{0} turns passed for {1} moves of the player".format(board.turn, player_moves))
+
+
+if __name__ == '__main__':
+    import sys
+    main(*(int(argument) for argument in sys.argv[1:]))
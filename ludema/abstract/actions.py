@@ -1,58 +1,89 @@
 import random
 from functools import wraps
-from ludema.abstract.utils import Direction
+from ludema.abstract.utils import Direction, Status
+from ludema.abstract.history import ActionHistory
 from ludema.exceptions import (PieceIsNotOnATileError,
                                PieceIsNotOnThisBoardError,
                                TileIsEmptyError,
                                NotGrabbableError)
 
+def _normal_default_action(name, direction):
+    """Return an action function which applies the action to the tile
+    next to the piece on direction. It takes the Action as its only argument,
+    so the very same function can be shared by all the actions.
+    """
+    def action_function(action):
+        return action.do(action.piece.surroundings[direction])
+    action_function.__name__ = action_function.__qualname__ = name
+    # lets legal_actions know where the action is going to be applied
+    action_function.direction = direction
+    return action_function
+
+# created once and for all, bound to each action when it needs them
+_NORMAL_DEFAULT_ACTIONS = (_normal_default_action('up', Direction.UP),
+                           _normal_default_action('right', Direction.RIGHT),
+                           _normal_default_action('down', Direction.DOWN),
+                           _normal_default_action('left', Direction.LEFT))
+
 class Action:
+    # how many actions the history of the actions keep by default.
+    # see ludema.abstract.history.ActionHistory for the possible values
+    history_length = 64
+    # True if using do passes a turn on the board of the piece, like
+    # it happens with the actions of the Player
+    passes_turn = False
+
     def __init__(self, piece, action_functions):
         self.possible_actions = []
         self.piece = piece
+        self.history = ActionHistory(self.history_length)
         if action_functions is None:
             action_functions = self._default_actions()
         self._set_actions(action_functions)
-        self.history = []
-
-    def __getattribute__(self, name):
-        attr = object.__getattribute__(self, name)
-        if attr in object.__getattribute__(self, 'possible_actions'):
-            attr = self._history_appender(attr)
-        return attr
 
     @property
     def is_implemented(self):
         """Return True if action is implemented, False if it can't."""
         return True if self.possible_actions else False
 
+    def keep_history(self, length):
+        """Change how many actions the history keeps. The actions kept
+        so far and the counts are forgotten.
+
+        Args:
+            length (int | None): ActionHistory.OFF (0) to keep none,
+                ActionHistory.UNBOUNDED (None) to keep them all, or
+                how many of the last ones to keep.
+        """
+        self.history = ActionHistory(length, self.history.names)
+
     def _history_appender(self, func):
+        code = self.history.code_of(func.__name__)
+
         @wraps(func)
         def history_wrapper(*args, **kwargs):
-            self.history.append(func.__name__)
+            self.history.record(code)
             return func(*args, **kwargs)
         return history_wrapper
 
     def _normal_default_actions(self):
         """Just a collection of four extremely normal set of default actions.
         The ones who apply the action to the tile up, right, left and down
-        of the piece.
+        of the piece. The functions are shared by all actions, we just bind
+        them to this one.
         """
-        def up():
-            return self.do(self.piece.surroundings[Direction.UP])
-        def right():
-            return self.do(self.piece.surroundings[Direction.RIGHT])
-        def down():
-            return self.do(self.piece.surroundings[Direction.DOWN])
-        def left():
-            return self.do(self.piece.surroundings[Direction.LEFT])
-        return [up, right, down, left]
+        return [function.__get__(self) for function in _NORMAL_DEFAULT_ACTIONS]
 
     def _set_actions(self, action_functions):
         """Sets the action_funcions as methods of the class
         and append them to the possible_actions list.
+
+        Each function is wrapped only once, right here, so that calling it
+        is recorded on the history. Calling an action costs the same on the
+        first turn than on the thousandth.
         """
         for action_function in action_functions:
+            action_function = self._history_appender(action_function)
             self.possible_actions.append(action_function)
             setattr(self, action_function.__name__, action_function)
 
@@ -109,23 +140,55 @@ class Action:
         return was_action_valid
 
     def random_and_valid(self):
-        """Call a random function from the possible actions,
-        making sure that the action is actually possible for the piece.
-        If no actions from the list of possible actions, it will just return
-        False.
+        """Call a random function from the actions which are legal right now,
+        as told by legal_actions. Only one action is performed, so
+        no piece is touched in vain. If no action is legal, it will just
+        return False.
 
         Returns:
             bool: True if there was a valid action to be made by the piece,
                 False if the piece couldn't move anywhere
         """
-        tries = 0
-        random_action_performed = self.random()
-        while not random_action_performed:
-            random_action_performed = self.random()
-            tries += 1
-            if tries >= len(self.possible_actions):
-                return False
-        return True
+        legal_actions = self.legal_actions()
+        if not legal_actions:
+            return False
+        return random.choice(legal_actions)()
+
+    def legal_actions(self):
+        """Return a list of the possible actions which would be performed
+        if called right now. Nothing is performed to find out, so no piece
+        is touched: pieces which would make way when touched are taken
+        as obstacles. Lines of pushable pieces are looked at, though.
+
+        Only the action functions with a direction attribute, like the
+        default ones, can be checked: they are expected to apply the action
+        to the tile next to the piece on that direction. The rest are
+        assumed to be legal.
+
+        Returns:
+            [functions]: the legal actions, in the order of possible_actions.
+            An empty list if the piece is not on a board.
+        """
+        home_tile = self.piece.home_tile
+        if home_tile is None:
+            return []
+        surroundings = home_tile.board.get_adjacent_to_tile(home_tile)
+        is_legal = self._is_legal
+        legal_actions = []
+        for action_function in self.possible_actions:
+            direction = getattr(action_function, 'direction', None)
+            if direction is None or is_legal(surroundings[direction]):
+                legal_actions.append(action_function)
+        return legal_actions
+
+    def _is_legal(self, tile):
+        """Return True if the action would be performed on tile, without
+        performing it nor changing anything at all.
+
+        Note:
+            Every action should implement this method.
+        """
+        raise NotImplementedError("The Action class shouldn't be used directly!")
 
     def all(self):
         """Call all possible actions from the list. The actions may or may
@@ -157,7 +220,17 @@ class Action:
         else:
             return False
 
+# the name of the default action going on each direction
+_DIRECTION_NAMES = {function.direction: function.__name__
+                    for function in _NORMAL_DEFAULT_ACTIONS}
+
+# the direction to go from one position to the next, by how much x and y change
+_DIRECTION_OF_STEP = {step: direction for direction, step in Direction.STEPS.items()}
+
 class Moving(Action):
+    # how many pushable pieces the piece can push at once. None for no limit
+    push_limit = None
+
     def __init__(self, piece, movement_functions):
         """
         Args:
@@ -186,22 +259,123 @@ class Moving(Action):
             PieceIsNotOnThisBoardError: if the piece you're trying to move
                 is in fact on another board
         """
-        if not self.piece.home_tile:
-            raise PieceIsNotOnATileError
-        if self.piece.home_tile.board is not tile.board:
-            raise PieceIsNotOnThisBoardError
+        status = self.try_move(tile)
+        if status == Status.NOT_ON_A_TILE:
+            raise PieceIsNotOnATileError(self.piece)
+        if status == Status.ON_ANOTHER_BOARD:
+            raise PieceIsNotOnThisBoardError(self.piece, tile.board)
+        return status == Status.OK or status == Status.PENDING
+
+    def try_move(self, tile):
+        """Move the object if it can. Never raises an exception: it tells
+        you what happened instead. This is what both do and _unsafe_do
+        use under the hood, and the cheapest way to try a move.
+
+        Moving into a pushable piece pushes it, together with all the
+        pushable pieces lined up behind it, and doesn't call on_touch_do.
+
+        While a simultaneous board is passing a turn, the move is only
+        taken note of, and made with the rest when the turn ends.
+        See :func:`~ludema.board.Board.resolve_moves`.
+
+        Args:
+            tile (Tile | None): the tile to which the piece will try to move.
+                None is taken as a tile outside of the board.
+
+        Returns:
+            int: Status.OK if the piece was moved, Status.PENDING if it
+            will be at the end of the turn. Status.OUT_OF_BOARD,
+            Status.OCCUPIED, Status.NOT_ON_A_TILE or Status.ON_ANOTHER_BOARD
+            if it wasn't.
+        """
+        if tile is None:
+            return Status.OUT_OF_BOARD
+        home_tile = self.piece.home_tile
+        if home_tile is None:
+            return Status.NOT_ON_A_TILE
+        board = tile.board
+        if home_tile.board is not board:
+            return Status.ON_ANOTHER_BOARD
+
+        # terrain can't be walked over nor reacts to touches, so we're done
+        if board._terrain_count and tile.terrain is not None:
+            return Status.OCCUPIED
+
+        if board._intents is not None:
+            board._intents[self.piece] = tile
+            return Status.PENDING
 
         if tile.piece is not None:
+            if tile.piece.pushable and not tile.piece.walkable:
+                return self.__push(tile)
             tile.piece.on_touch_do(touching_piece=self.piece)
             # what if tile.piece.on_touch_do actually moved the touched piece?
             # it could have, so we need to check if tile.piece still has
             # a piece...
             if tile.piece and not tile.piece.walkable:
-                return False
+                return Status.OCCUPIED
+
+        board._relocate(self.piece, tile)
+        return Status.OK
+
+    def __push(self, tile):
+        """Push the line of pieces starting on tile one tile away from the
+        piece, and move the piece to tile. Nothing moves unless everything
+        can move.
+        """
+        status, chain = self.__push_chain(tile)
+        if status != Status.OK:
+            return status
+        board = tile.board
+        # from the far end back, every piece takes the tile of the next one
+        destination = chain.pop()
+        for pushed_tile in reversed(chain):
+            board._relocate(pushed_tile.piece, destination)
+            destination = pushed_tile
+        board._relocate(self.piece, destination)
+        return Status.OK
+
+    def __push_chain(self, tile):
+        """Look at the line of pushable pieces starting on tile, without
+        moving anything. The line is walked iteratively, so it may be as
+        long as you want.
 
-        self.piece.home_tile.piece = None
-        tile.piece = self.piece
-        return True
+        Returns:
+            (int, [Tile]): Status.OK and the tiles of the pushable pieces,
+            nearest first, followed by the free tile at the end of the line.
+            Status.OCCUPIED and an empty list if the line can't be pushed.
+        """
+        here = self.piece.home_tile.position
+        step = (tile.position.x - here.x, tile.position.y - here.y)
+        direction = _DIRECTION_OF_STEP.get(step)
+        if direction is None:  # pieces can only be pushed from next to them
+            return Status.OCCUPIED, []
+        board = tile.board
+        limit = self.push_limit
+        chain = []
+        while True:
+            if tile is None:  # the line reaches the border of the board
+                return Status.OCCUPIED, []
+            if board._terrain_count and tile.terrain is not None:
+                return Status.OCCUPIED, []
+            piece = tile.piece
+            if piece is None or piece.walkable:
+                chain.append(tile)
+                return Status.OK, chain
+            if not piece.pushable or (limit is not None and len(chain) >= limit):
+                return Status.OCCUPIED, []
+            chain.append(tile)
+            tile = board.get_adjacent_to_tile(tile)[direction]
+
+    def _is_legal(self, tile):
+        if tile is None:
+            return False
+        if tile.board._terrain_count and tile.terrain is not None:
+            return False
+        piece = tile.piece
+        if piece is not None and piece.pushable and not piece.walkable:
+            return self.__push_chain(tile)[0] == Status.OK
+        return piece is None or piece.walkable
 
     def do(self, tile):
         """Move the object, if it can.
@@ -210,16 +384,95 @@ class Moving(Action):
             tile (Tile): the tile to which the piece will try to move.
 
         Returns:
-            bool: True if piece could be moved, False if not
+            bool: True if piece could be moved, or will be at the end of
+            the turn, False if not
         """
+        status = self.try_move(tile)
+        return status == Status.OK or status == Status.PENDING
 
-        if tile:
-            try:
-                return self._unsafe_do(tile)
-            except (PieceIsNotOnATileError, PieceIsNotOnThisBoardError):
-                return False
-        else:
-            return False
+    def follow(self, path, turn_per_step=True):
+        """Move the piece along path, step by step, stopping at the first
+        step it can't take. Much cheaper than calling the movements one
+        by one, but the result is the same: pieces are pushed and touched,
+        steps are kept on the history, under the name of their direction,
+        and if moving passes turns, turns pass.
+
+        On a board which is gathering simultaneous moves only the first
+        step is taken note of, as the piece can only move once per turn.
+
+        Args:
+            path ([Direction | Tile]): the steps. Either directions to move
+                towards, like Direction.UP, or tiles to move to, each next to
+                the one before it, the first one next to the piece.
+            turn_per_step (bool): if moving passes turns, pass one for
+                every step tried, as calling do would. If False, only one
+                turn passes for the whole path.
+
+        Returns:
+            int: how many steps were taken. len(path) if all of them were.
+
+        Raises:
+            ValueError: if a step of path is not a direction nor a tile,
+                or is a tile which isn't next to the step before it.
+                Nothing is moved in that case.
+        """
+        piece = self.piece
+        board = piece.home_tile.board if piece.home_tile is not None else None
+        directions = self.__directions_of(path)
+
+        history = self.history
+        try_move = self.try_move
+        passes_turn = self.passes_turn
+        taken = 0
+        for direction in directions:
+            home_tile = piece.home_tile
+            if home_tile is None:
+                break
+            history.append(_DIRECTION_NAMES[direction])
+            tile = home_tile.board.get_adjacent_to_tile(home_tile)[direction]
+            status = try_move(tile)
+            if passes_turn and turn_per_step:
+                board.turn += 1
+            if status == Status.PENDING:
+                taken += 1
+                break
+            if status != Status.OK:
+                break
+            taken += 1
+        if passes_turn and not turn_per_step and board is not None:
+            board.turn += 1
+        return taken
+
+    def __directions_of(self, path):
+        """Return the directions the piece has to move towards to follow
+        path, checking every step before anything moves.
+
+        Raises:
+            ValueError: if a step is not a direction nor a tile, or is a
+                tile which isn't next to the previous step
+        """
+        home_tile = self.piece.home_tile
+        position = home_tile.position if home_tile is not None else None
+        directions = []
+        for step in path:
+            if isinstance(step, int):
+                if step not in _DIRECTION_NAMES:
+                    raise ValueError("{0} is not a direction".format(step))
+                direction = step
+            elif not hasattr(step, 'position'):
+                raise ValueError("{0} is not a direction nor a tile".format(step))
+            elif position is None:  # the piece won't move anyway
+                direction = None
+            else:
+                x, y = step.position
+                direction = _DIRECTION_OF_STEP.get((x - position[0], y - position[1]))
+                if direction is None or step.board is not home_tile.board:
+                    raise ValueError("{0} is not next to {1}".format(step.position, position))
+            if position is not None:
+                step_x, step_y = Direction.STEPS[direction]
+                position = (position[0] + step_x, position[1] + step_y)
+            directions.append(direction)
+        return directions
 
 class Attacking(Action):
     def __init__(self, piece, attack_functions):
@@ -228,16 +481,53 @@ class Attacking(Action):
 
     def _unsafe_do(self, tile):
         """Attack a piece on tile passed as argument. If tile
-        has no piece, raise a TileIsEmptyError.
+        has no piece, or just terrain, raise a TileIsEmptyError.
 
         Args:
             tile (Tile): the tile which the piece will try to attack
         """
-        if tile.piece is None:
+        if not self._has_target(tile):
             raise TileIsEmptyError(self.piece, tile)
 
-        attacked_piece = tile.piece
-        attacked_piece.health -= self.piece.attack_damage
+        # the combat of the board deals the damage, maybe at the end of the turn
+        tile.board.combat.hit(tile.piece, self.piece.attack_damage)
+
+    def _is_legal(self, tile):
+        return tile is not None and self._has_target(tile)
+
+    @staticmethod
+    def _has_target(tile):
+        # terrain is shared by many tiles and has no home tile: hurting it
+        # would hurt it everywhere at once
+        piece = tile.piece
+        return piece is not None and piece.home_tile is not None
+
+    def area(self, stencil):
+        """Attack all the pieces on the tiles covered by stencil, centered
+        on the piece. Terrain is left alone. Great for explosions,
+        breath attacks and the like: see :mod:`ludema.abstract.stencils`.
+
+        Example:
+            ::
+                dragon.attack.area(cone(Direction.DOWN, 4))
+
+        Args:
+            stencil (Stencil): the area to attack
+
+        Returns:
+            int: how many pieces were attacked
+        """
+        home_tile = self.piece.home_tile
+        if home_tile is None:
+            return 0
+        board = home_tile.board
+        damage = self.piece.attack_damage
+        attacked = 0
+        for tile in board.tiles_in(stencil, *home_tile.position):
+            if self._has_target(tile):
+                board.combat.hit(tile.piece, damage)
+                attacked += 1
+        return attacked
 
     def do(self, tile):
         """Attack a tile passed as argument. Safe to use for I/O, should
@@ -248,7 +538,8 @@ class Attacking(Action):
 
         Returns:
             bool: True if attack could be performed, False if attack failed
-            (because the tile didn't have a piece associated or it was None)
+            (because the tile didn't have a piece associated, only terrain,
+            or it was None)
         """
         if tile:
             try:
@@ -267,19 +558,42 @@ class Grabbing(Action):
     def _unsafe_do(self, tile):
         """Grabs from the tile passed as argument.
 
+        While a simultaneous board is passing a turn, the grab is only
+        taken note of, and made with the rest when the turn ends.
+        See :func:`~ludema.board.Board.resolve_grabs`.
+
         Args:
-            tile (Tile): the tile which the piece will try to attack
+            tile (Tile): the tile which the piece will try to grab from
 
         Raises:
+            TileIsEmptyError if there's nothing on the tile
             NotGrabbableError if the piece on the tile can't be grabbed
         """
-        if not callable(tile.piece.grab):
-            raise NotGrabbableError(tile.piece)
-
         grabbable = tile.piece
+        if grabbable is None:
+            raise TileIsEmptyError(self.piece, tile)
+        if not self._is_grabbable(grabbable):
+            raise NotGrabbableError(grabbable)
+
+        board = tile.board
+        if board._grabs is not None:
+            board._grabs[self.piece] = tile
+            return
+        board.remove_piece(grabbable)
         grabbable.owner = self.piece
-        self.piece.items.append(grabbable)
-        tile.piece = None  # POPS!
+        self.piece.items.add(grabbable)
+
+    def _is_legal(self, tile):
+        return tile is not None and self._is_grabbable(tile.piece)
+
+    @staticmethod
+    def _is_grabbable(piece):
+        """Items are the only pieces which can be grabbed, and the only
+        ones which can have an owner. Terrain, which has no home tile,
+        can't be grabbed either.
+        """
+        return (piece is not None and hasattr(piece, 'owner')
+                and piece.home_tile is not None)
 
     def do(self, tile):
         """Grabs from the tile passed as argument. Safe to use for I/O, should
@@ -296,7 +610,7 @@ class Grabbing(Action):
         try:
             self._unsafe_do(tile)
             return True
-        except TileIsEmptyError:
+        except (TileIsEmptyError, NotGrabbableError):
             return False
 
     def from_surroundings(self):
@@ -0,0 +1,126 @@
+from array import array
+
+"""
+The purpose of this module is to remember what the pieces did
+without needing more and more memory as the game goes on.
+"""
+
+
+class ActionHistory:
+    """The actions performed through an Action interface, oldest first.
+
+    Every action is stored as a small integer code on an array, and only
+    the last length of them are kept, so the memory a history takes is
+    fixed no matter how long the game is. It still behaves like the list of
+    action names it used to be: history[-1], history[2:5], len(history)
+    and iterating over it give you names.
+
+    How many times each action was performed is counted since the history
+    was created, even for the actions which are not kept anymore and even
+    if the history is off.
+    """
+    OFF = 0
+    UNBOUNDED = None
+
+    def __init__(self, length=64, names=()):
+        """
+        Args:
+            length (int | None): how many actions to keep. ActionHistory.OFF
+                (0) keeps none, ActionHistory.UNBOUNDED (None) keeps them all.
+            names ([str]): names of actions to give codes to right away
+        """
+        if length is not None and length < 0:
+            raise ValueError("The length of a history can't be negative.")
+        self.length = length
+        self.names = []  # code -> name
+        self._codes = {}  # name -> code
+        self._counts = array('L')  # code -> how many times it was performed
+        self._buffer = array('H')  # codes, a ring once it has length of them
+        self._start = 0  # where the oldest code is, once the ring is full
+        for name in names:
+            self.code_of(name)
+
+    def code_of(self, name):
+        """Return the code for the action called name, giving it one if
+        it didn't have it.
+        """
+        code = self._codes.get(name)
+        if code is None:
+            code = self._codes[name] = len(self.names)
+            self.names.append(name)
+            self._counts.append(0)
+        return code
+
+    def append(self, name):
+        """Remember that the action called name was performed."""
+        self.record(self.code_of(name))
+
+    def record(self, code):
+        """Remember that the action with the code given was performed.
+        This is what the actions use, as they know their codes beforehand.
+        """
+        self._counts[code] += 1
+        buffer = self._buffer
+        length = self.length
+        if length is None or len(buffer) < length:
+            buffer.append(code)
+        elif length:
+            buffer[self._start] = code
+            self._start = (self._start + 1) % length
+
+    def last(self):
+        """Return the name of the last action kept, or None if there's none."""
+        buffer = self._buffer
+        if not buffer:
+            return None
+        return self.names[buffer[self._start - 1]]
+
+    def count(self, name):
+        """Return how many times the action called name was performed."""
+        code = self._codes.get(name)
+        return 0 if code is None else self._counts[code]
+
+    def counts(self):
+        """Return a {name: times performed} dictionary of all the actions
+        performed at least once.
+        """
+        return {name: count for name, count in zip(self.names, self._counts) if count}
+
+    def clear(self):
+        """Forget all the actions kept and all the counts."""
+        self._buffer = array('H')
+        self._counts = array('L', bytes(self._counts.itemsize * len(self.names)))
+        self._start = 0
+
+    def __len__(self):
+        return len(self._buffer)
+
+    def __bool__(self):
+        return bool(self._buffer)
+
+    def __getitem__(self, index):
+        buffer = self._buffer
+        size = len(buffer)
+        if isinstance(index, slice):
+            return [self.names[buffer[(self._start + i) % size]]
+                    for i in range(*index.indices(size))]
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("history index out of range")
+        return self.names[buffer[(self._start + index) % size]]
+
+    def __iter__(self):
+        names, buffer, start = self.names, self._buffer, self._start
+        for code in buffer[start:]:
+            yield names[code]
+        for code in buffer[:start]:
+            yield names[code]
+
+    def __eq__(self, other):
+        if isinstance(other, (ActionHistory, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return "ActionHistory({0}, length={1})".format(list(self), self.length)
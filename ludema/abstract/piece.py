@@ -3,9 +3,12 @@ from ludema.abstract.actions import Moving, Attacking, Grabbing
 from ludema.exceptions import PieceIsNotOnATileError
 
 class Piece:
+    __slots__ = ('name', 'letter', 'walkable', 'pushable', '__home_tile', 'health',
+                 '_movements', '_attacks', '_move', '_attack', '_grab', '__weakref__')
 
     def __init__(self, letter, name=None, walkable=False, movements=None,
-                 attacks=None, health=-1, turn_increasing_actions=None):
+                 attacks=None, health=-1, turn_increasing_actions=None,
+                 pushable=False):
         """Defines a Piece, which is _anything_ that can
         be represented on the map.
 
@@ -20,6 +23,8 @@ class Piece:
         respective interfaces. The Moving interface is asigned to the
         Piece.move variable, and Attacking to Piece.attack, the Grabbing
         to Piece.grab, and so on.For example usage, see the bottom of this docstring.
+        The interfaces are only created the first time they are used, so
+        pieces which never act, like walls, don't pay for them.
 
         Note:
             Pieces can always grab from the same places they can move to.
@@ -54,6 +59,10 @@ class Piece:
 
             health (int): how much Health Points should this piece have?
                 any negative number means "infinite health"
+            pushable (bool): Can the piece be pushed by other pieces moving
+                into it? A whole line of pushable pieces is pushed at once,
+                as long as there's room at its end. Walkable pieces are
+                walked over, never pushed.
 
         Example:
             ::
@@ -72,11 +81,56 @@ class Piece:
         self.name = name
         self.letter = "{0}{1}".format(letter, Style.RESET_ALL)
         self.walkable = walkable
+        self.pushable = pushable
         self.__home_tile = None
         self.health = health
-        self.move = Moving(self, movements)
-        self.attack = Attacking(self, attacks)
-        self.grab = Grabbing(self, movements)  # grab from same place they can move to
+        self._movements = movements
+        self._attacks = attacks
+        self._move = None
+        self._attack = None
+        self._grab = None
+
+    def _new_action(self, name, action_class, action_functions):
+        """Create the action interface the property name of the piece gives
+        access to. Called only once per interface, so subclasses can attach
+        whatever they want to the interfaces here, like the Player does
+        to pass turns.
+        """
+        return action_class(self, action_functions)
+
+    @property
+    def move(self):
+        """The Moving interface of the piece."""
+        if self._move is None:
+            self._move = self._new_action('move', Moving, self._movements)
+        return self._move
+
+    @move.setter
+    def move(self, move):
+        self._move = move
+
+    @property
+    def attack(self):
+        """The Attacking interface of the piece."""
+        if self._attack is None:
+            self._attack = self._new_action('attack', Attacking, self._attacks)
+        return self._attack
+
+    @attack.setter
+    def attack(self, attack):
+        self._attack = attack
+
+    @property
+    def grab(self):
+        """The Grabbing interface of the piece."""
+        if self._grab is None:
+            # grab from same place they can move to
+            self._grab = self._new_action('grab', Grabbing, self._movements)
+        return self._grab
+
+    @grab.setter
+    def grab(self, grab):
+        self._grab = grab
 
     @property
     def home_tile(self):
@@ -101,7 +155,7 @@ class Piece:
 
     @property
     def surroundings(self):
-        """If object has a home_tile, return a dictionary that looks like
+        """If object has a home_tile, return a read-only mapping that looks like
         {Direction : Tile or None} for each of the four cardinal directions.
         Value will be None if the direction is outside the map.
 
@@ -0,0 +1,123 @@
+import math
+from functools import lru_cache
+from ludema.abstract.utils import Direction
+
+try:
+    import numpy
+except ImportError:  # only Stencil.mask needs it
+    numpy = None
+
+"""
+The purpose of this module is to describe areas around a position, like
+'everything at most three tiles away', so items and attacks can affect
+them without walking the board. Stencils are computed once per shape and
+size, and cached.
+"""
+
+
+class Stencil:
+    """The offsets (dx, dy) of the positions of an area, relative to its
+    center. The center itself is never part of it. Offsets go from the
+    nearest to the farthest, clockwise starting from up.
+
+    Use :func:`~ludema.board.Board.tiles_in` to get the tiles of a board
+    covered by a stencil.
+    """
+    __slots__ = ('offsets', 'min_dx', 'max_dx', 'min_dy', 'max_dy', '_arrays')
+
+    def __init__(self, offsets):
+        """
+        Args:
+            offsets ([(int, int)]): the offsets of the area
+        """
+        def order(offset):
+            dx, dy = offset
+            # clockwise from up, which is (0, 1)
+            return dx * dx + dy * dy, math.atan2(dx, dy) % (2 * math.pi)
+        self.offsets = tuple(sorted(set(offsets) - {(0, 0)}, key=order))
+        self.min_dx = min((dx for dx, _ in self.offsets), default=0)
+        self.max_dx = max((dx for dx, _ in self.offsets), default=0)
+        self.min_dy = min((dy for _, dy in self.offsets), default=0)
+        self.max_dy = max((dy for _, dy in self.offsets), default=0)
+        self._arrays = None
+
+    def __iter__(self):
+        return iter(self.offsets)
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __repr__(self):
+        return "Stencil({0})".format(list(self.offsets))
+
+    def positions(self, x, y):
+        """Return a list of the (x, y) positions covered by the stencil
+        when centered on x, y. Nothing is clipped.
+        """
+        return [(x + dx, y + dy) for dx, dy in self.offsets]
+
+    def mask(self, x, y, shape):
+        """Return a boolean NumPy array of the given shape, True on the
+        positions covered by the stencil when centered on x, y and False
+        elsewhere. Good as the where argument of the layers of a board.
+        """
+        if numpy is None:
+            raise ImportError("NumPy is needed to get the mask of a stencil. "
+                              "Install it with: pip install numpy")
+        if self._arrays is None:
+            offsets = numpy.array(self.offsets, dtype=numpy.intp).reshape(-1, 2)
+            self._arrays = offsets[:, 0], offsets[:, 1]
+        xs, ys = self._arrays[0] + x, self._arrays[1] + y
+        inside = (xs >= 0) & (xs < shape[0]) & (ys >= 0) & (ys < shape[1])
+        mask = numpy.zeros(shape, dtype=bool)
+        mask[xs[inside], ys[inside]] = True
+        return mask
+
+
+@lru_cache(maxsize=None)
+def diamond(radius):
+    """The positions at most radius steps away, walking up, right, down
+    or left. diamond(1) are the four tiles around the center.
+    """
+    return Stencil((dx, dy) for dx in range(-radius, radius + 1)
+                   for dy in range(-radius, radius + 1)
+                   if abs(dx) + abs(dy) <= radius)
+
+
+@lru_cache(maxsize=None)
+def square(radius):
+    """The positions at most radius steps away, diagonals included.
+    square(1) are the eight tiles around the center.
+    """
+    return Stencil((dx, dy) for dx in range(-radius, radius + 1)
+                   for dy in range(-radius, radius + 1))
+
+
+@lru_cache(maxsize=None)
+def circle(radius):
+    """The positions at most radius positions away, as the crow flies."""
+    squared_radius = radius * radius
+    return Stencil((dx, dy) for dx in range(-radius, radius + 1)
+                   for dy in range(-radius, radius + 1)
+                   if dx * dx + dy * dy <= squared_radius)
+
+
+@lru_cache(maxsize=None)
+def line(direction, length):
+    """The length positions going from the center towards direction."""
+    step_x, step_y = Direction.STEPS[direction]
+    return Stencil((step_x * distance, step_y * distance)
+                   for distance in range(1, length + 1))
+
+
+@lru_cache(maxsize=None)
+def cone(direction, length):
+    """A triangle opening from the center towards direction, length
+    positions long. It's one position wide next to the center, and gets
+    one position wider on each side with every step.
+    """
+    step_x, step_y = Direction.STEPS[direction]
+    side_x, side_y = step_y, step_x  # perpendicular to the direction
+    return Stencil((step_x * distance + side_x * side, step_y * distance + side_y * side)
+                   for distance in range(1, length + 1)
+                   for side in range(-distance + 1, distance))
@@ -8,3 +8,22 @@ class Direction:
     RIGHT = 1
     DOWN = 2
     LEFT = 3
+
+    # how much x and y change when going in each direction
+    STEPS = {UP: (0, 1),
+             RIGHT: (1, 0),
+             DOWN: (0, -1),
+             LEFT: (-1, 0)}
+
+
+class Status:
+    """What happened when trying to put or move a piece somewhere.
+    Returned by the methods which don't raise exceptions, like
+    Board.try_put or Moving.try_move.
+    """
+    OK = 0
+    OUT_OF_BOARD = 1
+    OCCUPIED = 2  # by a piece which is not walkable, or by terrain
+    NOT_ON_A_TILE = 3  # the piece trying to move isn't on a board
+    ON_ANOTHER_BOARD = 4  # the piece trying to move is on another board
+    PENDING = 5  # the move will be made when the turn ends, see Board.resolve_moves
@@ -0,0 +1,117 @@
+from ludema.registry import plain_letter
+
+try:
+    import numpy
+except ImportError:  # numpy is only needed if you want your boards as arrays
+    numpy = None
+
+"""
+The purpose of this module is to expose the state of a board as NumPy arrays,
+for analytics or for AIs which work on the whole board at once.
+All the arrays are indexed just like the board: array[x, y].
+"""
+
+
+def _require_numpy():
+    if numpy is None:
+        raise ImportError("NumPy is needed to see boards as arrays. "
+                          "Install it with: pip install numpy")
+
+
+class BoardArrays:
+    """NumPy arrays describing the contents of every position of a board.
+
+    The arrays are kept up to date by the board every time a piece is put,
+    removed or moved, so reading them is free. The arrays you get are
+    read-only views of the ones the board writes to: they always show the
+    current state of the board, and copying them is up to you.
+
+    Note:
+        Don't create these yourself, use :func:`~ludema.board.Board.use_arrays`.
+    """
+    def __init__(self, board):
+        _require_numpy()
+        if board.size_x is None or board.size_y is None:
+            raise ValueError("Unbounded boards can't be seen as arrays.")
+        self.board = board
+        shape = (board.size_x, board.size_y)
+        self._occupancy = numpy.zeros(shape, dtype=bool)
+        self._walkability = numpy.ones(shape, dtype=bool)
+        self._kinds = numpy.zeros(shape, dtype=numpy.int16)
+        self._letters = numpy.zeros(shape, dtype=numpy.int32)
+        self.kind_codes = {}  # piece class -> its code on the kinds array
+        self._letter_codes = {}  # piece letter -> its code on the letters array
+
+        self.occupancy = self.__read_only(self._occupancy)
+        self.walkability = self.__read_only(self._walkability)
+        self.kinds = self.__read_only(self._kinds)
+        self.letters = self.__read_only(self._letters)
+
+        self.__fill()
+
+    @staticmethod
+    def __read_only(array):
+        view = array.view()
+        view.flags.writeable = False
+        return view
+
+    def __fill(self):
+        """Write down everything there is on the board right now."""
+        board = self.board
+        for piece in board.registry:
+            self.refresh(*piece.home_tile.position)
+
+        if isinstance(board._terrain, bytearray):
+            codes = numpy.frombuffer(board._terrain, dtype=numpy.uint8)
+            codes = codes.reshape(board.size_x, board.size_y)
+            for code, terrain in enumerate(board.terrain_kinds):
+                if terrain is not None:
+                    self.__write(codes == code, terrain)
+        else:
+            for x, y in board._terrain:
+                self.refresh(x, y)
+
+    def kind_code(self, piece_class):
+        """Return the code for piece_class on the kinds array. Codes are given
+        in order of appearance, starting with 1. 0 means no piece.
+        """
+        code = self.kind_codes.get(piece_class)
+        if code is None:
+            code = self.kind_codes[piece_class] = len(self.kind_codes) + 1
+        return code
+
+    def letter_code(self, letter):
+        """Return the code for letter on the letters array: the unicode code
+        point of the first character of the letter, without colors.
+        0 means no piece.
+        """
+        code = self._letter_codes.get(letter)
+        if code is None:
+            plain = plain_letter(letter)
+            code = self._letter_codes[letter] = ord(plain[0]) if plain else 0
+        return code
+
+    def refresh(self, x, y):
+        """Write down the contents of the position x, y of the board."""
+        self.__write((x, y), self.board.board[x][y].piece)
+
+    def __write(self, where, piece):
+        if piece is None:
+            self._occupancy[where] = False
+            self._walkability[where] = True
+            self._kinds[where] = 0
+            self._letters[where] = 0
+        else:
+            self._occupancy[where] = True
+            self._walkability[where] = piece.walkable
+            self._kinds[where] = self.kind_code(type(piece))
+            self._letters[where] = self.letter_code(piece.letter)
+
+
+def codes_in(codes):
+    """Yield (x, y, code) for every non zero code of a 2D array of codes."""
+    _require_numpy()
+    codes = numpy.asarray(codes)
+    xs, ys = numpy.nonzero(codes)
+    for x, y in zip(xs.tolist(), ys.tolist()):
+        yield x, y, codes[x, y].item()
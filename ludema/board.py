@@ -1,11 +1,23 @@
+import weakref
+from array import array
+from types import MappingProxyType
 from ludema import pieces
 from ludema import utils
-from ludema.abstract.utils import Position, Direction
+from ludema.abstract.utils import Position, Direction, Status
 from ludema.abstract.piece import Piece
+from ludema.registry import PieceRegistry
+from ludema.spatial import SpatialHash
+from ludema.arrays import BoardArrays, codes_in
+from ludema.layers import Layer
+from ludema.combat import Combat
+from ludema.scheduler import Scheduler
+from ludema.timers import TimerWheel
 from ludema.exceptions import (PieceIsNotOnThisBoardError, OutOfBoardError,
                                PositionOccupiedError, TurnCanOnlyBeIncreased,
                                TurnsAreOver, WrongSizeOnX, WrongSizeOnY,
-                               RowsOfDifferentSizes)
+                               RowsOfDifferentSizes, WalkableTerrainError,
+                               TooManyTerrainKinds, TileIsEmptyError,
+                               NotGrabbableError)
 
 """
 The purpose of this module is to define a board where the pieces can move.
@@ -20,7 +32,8 @@ class Board:
     """Defines a simple rectangular map where the Pieces interact.  """
     @classmethod
     def new_from_blueprint(cls, name, blueprint, legend, win_conditions,
-                           lose_conditions, empty_repr = "   ", turn_limit=-1):
+                           lose_conditions, empty_repr = "   ", turn_limit=-1,
+                           compact=False, terrain=None):
         """An alternative creator for Board, which uses Board.fill_board_with_blueprint
         inmediatly after creation to create a board according to a blueprint
         and a legend. Refer to documentation for that method for more information.
@@ -37,16 +50,55 @@ class Board:
             empty_repr (str): what should an empty espace be represented as?
             turn_limit: (int): if turn limit is passed, raise TurnsAreOver error.
                 any negative number will be interpreted as no turn limit.
+            compact (bool): use the compact storage for the board.
+                See :class:`~ludema.board.Board` for details.
+            terrain ({key: Piece}): pieces of the blueprint which should go
+                to the terrain layer of the board. See
+                :func:`~ludema.board.Board.fill_board_with_blueprint`.
         """
 
         blueprint = blueprint.replace(" ", "")
         lines = blueprint.split('\n')[1:-1]
-        board = cls(name, len(lines[0]), len(lines), win_conditions, lose_conditions, empty_repr, turn_limit)
-        board.fill_board_with_blueprint(blueprint, legend)
+        board = cls(name, len(lines[0]), len(lines), win_conditions, lose_conditions,
+                    empty_repr, turn_limit, compact=compact)
+        board.fill_board_with_blueprint(blueprint, legend, terrain)
+        return board
+
+    @classmethod
+    def new_from_arrays(cls, name, codes, legend, win_conditions,
+                        lose_conditions, empty_repr="   ", turn_limit=-1,
+                        compact=False, terrain=None):
+        """An alternative creator for Board, which uses Board.fill_board_with_arrays
+        inmediatly after creation. The size of the board will be the shape of
+        codes. Refer to documentation for that method for more information.
+
+        Needs NumPy.
+
+        Args:
+            name (str): the name of the board
+            codes (2D array of ints): the codes of the pieces on the board
+            legend ({code: (Piece | [Piece] | (nullary function -> Piece}): legend
+                for the codes
+            win_conditions ([nullary functions]): each turn will be evaluated, if
+                ONE returns True, the board is WON
+            lose_condtitions ([nullary functions]): idem win_conditions, but if ONE
+                returns True, the board is considered lost
+            empty_repr (str): what should an empty espace be represented as?
+            turn_limit: (int): if turn limit is passed, raise TurnsAreOver error.
+                any negative number will be interpreted as no turn limit.
+            compact (bool): use the compact storage for the board.
+                See :class:`~ludema.board.Board` for details.
+            terrain ({code: Piece}): codes which should go to the terrain layer
+                of the board.
+        """
+        size_x, size_y = codes.shape
+        board = cls(name, size_x, size_y, win_conditions, lose_conditions,
+                    empty_repr, turn_limit, compact=compact)
+        board.fill_board_with_arrays(codes, legend, terrain)
         return board
 
     def __init__(self, name, size_x, size_y, win_conditions, lose_conditions,
-                 empty_repr="   ", turn_limit=-1):
+                 empty_repr="   ", turn_limit=-1, compact=False):
         """
         Args:
             name (str): the name of the board
@@ -59,6 +111,11 @@ class Board:
             empty_repr (str): what should an empty espace be represented as?.
             turn_limit: (int): if turn limit is passed, raise TurnsAreOver error.
                 any negative number will be interpreted as no turn limit.
+            compact (bool): if True, the board won't create a Tile for every
+                position. It will keep the pieces on a flat array instead and
+                create Tiles on demand, as thin views over that array.
+                Useful for huge, mostly empty maps. board.board[x][y] works
+                exactly the same on both kinds of storage.
 
         See also:
             :func:`~ludema.board.Board.new_from_blueprint`: alternative contructor for a Board.
@@ -70,11 +127,32 @@ class Board:
         self.size_x = size_x
         self.size_y = size_y
         self.empty_repr = empty_repr
-        self.board = self.__create_board(size_x, size_y)
-        self.players = []
-        self.npcs = []  # non playable characters
+        self.compact = compact
+        self.board = self._create_board(size_x, size_y)
+        self.terrain_kinds = [None]  # terrain code -> terrain piece
+        self._terrain_codes = {}  # terrain piece -> terrain code
+        self._terrain = self._create_terrain(size_x, size_y)
+        self._terrain_count = 0  # how many positions have terrain
+        if not compact:  # compact boards compute them lazily, tile by tile
+            self.__link_neighbours()
+        self.registry = PieceRegistry()
+        self.spatial = SpatialHash()
+        self.arrays = None
+        self._layers = {}  # name -> Layer
         self.turn_limit = turn_limit
         self._turn = 0
+        # if True, the characters move all at once when a turn passes.
+        # see Board.resolve_moves
+        self.simultaneous = False
+        self._intents = None  # piece -> tile, while gathering simultaneous moves
+        self._grabs = None  # piece -> tile, while gathering simultaneous grabs
+        self.combat = Combat(self)
+        self.scheduler = Scheduler()
+        self.timers = TimerWheel()
+        # if not None, only the NPCs at most this far from a player act.
+        # see Board._pass_turn
+        self.activity_radius = None
+        self._active = None  # npc -> None, the ones allowed to act last turn
 
     @property
     def won(self):
@@ -90,6 +168,16 @@ class Board:
         """
         return any([lose_condition() for lose_condition in self.lose_conditions])
 
+    @property
+    def players(self):
+        """A list of the Players on the board. Has no setter."""
+        return list(self.registry.of_type(pieces.Player))
+
+    @property
+    def npcs(self):
+        """A list of the non playable characters on the board. Has no setter."""
+        return list(self.registry.of_type(pieces.NPC))
+
     @property
     def turn(self):
         """This property defines the turns passed on the board.
@@ -105,24 +193,268 @@ class Board:
             raise TurnCanOnlyBeIncreased(self.turn, new_turn)
         turns_passed = new_turn - self._turn  # in most cases this should be 1
         for _ in range(turns_passed):
-            for character in (self.npcs + self.players):
-                character.do_passive_action()
+            self._pass_turn()
         self._turn = new_turn
         if self.turn_limit > 0 and self._turn > self.turn_limit:
             raise TurnsAreOver(self)
 
-    def __create_board(self, size_x, size_y):
+    def schedule(self, turns, callback, every=None):
+        """Call callback when turns more turns have passed on the board,
+        and then every every turns, if every is not None. Use it for things
+        like poison, doors which close by themselves or spawners, instead
+        of counting turns on do_passive_action.
+
+        Timers fire after the characters act on the turn, and before the
+        dead are taken out of the board: characters killed by a timer,
+        be it through board.combat.hit or by lowering their health, are
+        taken out on that same turn. Dead players are left on the board,
+        see :class:`~ludema.combat.Combat`.
+
+        Args:
+            turns (int): how many turns from now it should be called. At least 1.
+            callback (nullary function): what to call
+            every (int | None): how often to call it again afterwards.
+                None to call it just once.
+
+        Returns:
+            Timer: the timer. Call its cancel method to cancel it.
+
+        Raises:
+            ValueError: if turns or every are less than 1
+        """
+        return self.timers.schedule(turns, callback, every)
+
+    def _create_terrain(self, size_x, size_y):
+        """Return the array holding the terrain code of every position."""
+        return bytearray(size_x * size_y)
+
+    def _pass_turn(self):
+        """Make the characters on the board react to a single turn passing.
+        Which ones, and how many times, is up to the scheduler of the board.
+
+        If board.activity_radius is not None, the NPCs further away than it
+        from every player are frozen, and don't act at all. When a player
+        gets close again, their catch_up method is called with how many
+        turns they missed, and they start acting again. Passing a turn then
+        only costs as much as the NPCs around the players.
+
+        On simultaneous boards the moves and grabs of the characters are
+        only gathered while they react, and their attacks batched. The grabs
+        are resolved all at once afterwards, and then the moves.
+        Then the timers due on the turn fire, see Board.schedule, and
+        finally the attacks are dealt and the dead are taken out of the
+        board, but for dead players, which are left on it.
+        """
+        if self.activity_radius is not None or self._active is not None:
+            self.__cull()
+        if self.simultaneous:
+            self._intents, self._grabs = {}, {}
+        try:
+            self.scheduler.tick(self.__act)
+        finally:
+            intents, self._intents = self._intents, None
+            grabs, self._grabs = self._grabs, None
+        if grabs:
+            self.resolve_grabs(grabs)
+        if intents:
+            self.resolve_moves(intents)
+        self.timers.tick()
+        self.combat.resolve()
+
+    def __cull(self):
+        """Freeze the NPCs which went too far from the players, and thaw the
+        ones which came close. Only looks at the NPCs allowed to act on the
+        last turn, the new ones, and the ones around the players.
+        """
+        scheduler = self.scheduler
+        if self.activity_radius is None:  # culling was turned off
+            for npc in list(scheduler.frozen):
+                npc.catch_up(scheduler.thaw(npc))
+            self._active = None
+            return
+
+        near = {}
+        for player in self.registry.of_type(pieces.Player):
+            x, y = player.position
+            for npc in self.spatial.within(x, y, self.activity_radius, pieces.NPC):
+                near[npc] = None
+        # the first time, every npc may need to be frozen
+        active = self._active if self._active is not None else self.registry.of_type(pieces.NPC)
+        for npc in active:
+            if npc not in near and isinstance(npc, pieces.NPC):
+                scheduler.freeze(npc)
+        for npc in near:
+            if scheduler.is_frozen(npc):
+                npc.catch_up(scheduler.thaw(npc))
+        self._active = near
+
+    @staticmethod
+    def __act(character):
+        # a character may have been killed by the ones acting before it
+        if not character.is_dead:
+            return character.do_passive_action()
+
+    def resolve_grabs(self, grabs):
+        """Make several pieces grab as if they all grabbed at the same time.
+        If several pieces want to grab the same piece, the one which was put
+        on the board first gets it. Grabs of pieces which can't be grabbed
+        anymore fail.
+
+        This is what boards do when a turn passes if board.simultaneous is
+        True, with the grabs the characters make on their passive actions,
+        before their moves are resolved.
+
+        Args:
+            grabs ({Piece: Tile}): the tile each piece wants to grab from
+
+        Returns:
+            {Piece: bool}: whether each piece grabbed something
+        """
+        id_of = self.registry.id_of
+        grabbed = {}
+        for piece in sorted(grabs, key=lambda piece: id_of(piece) or 0):
+            if piece not in self.registry:  # removed while the turn passed
+                grabbed[piece] = False
+                continue
+            try:
+                # not do, which would pass a turn again on players
+                piece.grab._unsafe_do(grabs[piece])
+                grabbed[piece] = True
+            except (TileIsEmptyError, NotGrabbableError):
+                grabbed[piece] = False
+        return grabbed
+
+    def resolve_moves(self, intents):
+        """Move several pieces as if they all moved at the same time, so the
+        result doesn't depend on the order of the moves. These are the rules:
+
+        * Pieces can follow pieces which move away, in lines or in circles.
+          Two pieces can't swap places, though.
+        * If several pieces want to go to the same tile, the one which was
+          put on the board first goes, and the rest stay.
+        * Moves into pieces which don't move away, be them pushable or not,
+          are made after all the others, one by one, in the order the
+          pieces were put on the board. These are ordinary moves: they
+          push and touch pieces as usual.
+
+        This is what boards do when a turn passes if board.simultaneous is
+        True, with the moves the characters make on their passive actions.
+        While they act, their moves, grabs and attacks don't change the
+        board: moves and grabs are only taken note of, see
+        :func:`~ludema.board.Board.resolve_grabs`, and attacks are batched
+        until the turn ends, see :class:`~ludema.combat.Combat`. Anything
+        else they do, like changing health by hand or using items, happens
+        right away.
+
+        Args:
+            intents ({Piece: Tile}): the tile where each piece wants to go
+
+        Returns:
+            {Piece: int}: the Status of the move of each piece.
+        """
+        statuses = {}
+        id_of = self.registry.id_of
+        winners = {}  # tile -> the piece which will try to go there
+        for piece, tile in intents.items():
+            status = self.__move_status(piece, tile)
+            if status != Status.OK:
+                statuses[piece] = status
+                continue
+            rival = winners.get(tile)
+            if rival is None:
+                winners[tile] = piece
+            elif id_of(piece) < id_of(rival):
+                statuses[rival] = Status.OCCUPIED
+                winners[tile] = piece
+            else:
+                statuses[piece] = Status.OCCUPIED
+        moves = {piece: tile for tile, piece in winners.items()}
+
+        leaving = {}  # piece -> True if it moves along with the rest
+        touching = []  # pieces moving into pieces which stay
+        for piece in moves:
+            if piece in leaving:
+                continue
+            # follow the line of pieces each one wants to move into, until
+            # reaching one we know whether moves or not
+            line = [piece]
+            while True:
+                blocker = moves[line[-1]].piece
+                if blocker is None or blocker.walkable:
+                    leaves = True
+                elif blocker in leaving:
+                    leaves = leaving[blocker]
+                elif blocker not in moves:
+                    touching.append(line[-1])
+                    leaving[line.pop()] = False
+                    leaves = False
+                elif blocker in line:  # a circle. only the start can close it
+                    leaves = len(line) > 2
+                else:
+                    line.append(blocker)
+                    continue
+                break
+            for follower in line:
+                leaving[follower] = leaves
+
+        movers = [piece for piece in moves if leaving[piece]]
+        origins = [piece.home_tile for piece in movers]
+        # everyone leaves first, so no one gets in the way of anyone
+        for piece, origin in zip(movers, origins):
+            origin._remove(piece)
+        for piece, origin in zip(movers, origins):
+            tile = moves[piece]
+            tile._push(piece)
+            piece.home_tile = tile
+            self.spatial.move(piece, tile.position.x, tile.position.y)
+            statuses[piece] = Status.OK
+        for tile in origins + [moves[piece] for piece in movers]:
+            self._tile_changed(tile.position.x, tile.position.y)
+
+        for piece in moves:
+            if piece not in statuses and piece not in touching:
+                statuses[piece] = Status.OCCUPIED
+        for piece in sorted(touching, key=id_of):
+            statuses[piece] = piece.move.try_move(moves[piece])
+        return statuses
+
+    def __move_status(self, piece, tile):
+        """Return what would happen to piece if it moved to tile right now,
+        as far as can be told without looking at the pieces on tile.
+        """
+        if tile is None:
+            return Status.OUT_OF_BOARD
+        home_tile = piece.home_tile
+        if home_tile is None:
+            return Status.NOT_ON_A_TILE
+        if home_tile.board is not self or tile.board is not self:
+            return Status.ON_ANOTHER_BOARD
+        if self._terrain_count and tile.terrain is not None:
+            return Status.OCCUPIED
+        return Status.OK
+
+    def _create_board(self, size_x, size_y):
         """Fill board with empty tiles.
 
         Args:
             size_x: width of board
             size_y: height of board
         """
+        if self.compact:
+            return _CompactGrid(self, size_x, size_y)
         board = []
         for x in range(size_x):
             board.append([Tile(self, Position(x, y)) for y in range(size_y)])
         return board
 
+    def __link_neighbours(self):
+        """Compute the surroundings of every tile on the board.
+        The neighbours of a tile never change, so we do it once and for all.
+        """
+        for column in self.board:
+            for tile in column:
+                self.get_adjacent_to_tile(tile)
+
     def __str__(self):
         """How the board will represented as a string."""
 
@@ -130,11 +462,13 @@ class Board:
         # what you're doing
 
         def board_from_column_to_rows():
-            """Our board is a list of COLUMNS. Return a list of ROWS."""
+            """Our board is a list of COLUMNS. Return a list of ROWS,
+            each of them a list of the strings representing its tiles.
+            """
             rows = []
             # range is reversed so as to start printing from the topmost row
-            for y in reversed(range(self.size_y)):
-                row = [self.board[x][y] for x in range(self.size_x)]
+            for y in reversed(self._y_range()):
+                row = [self._str_at(x, y) for x in self._x_range()]
                 rows.append(row)
             return rows
 
@@ -142,21 +476,36 @@ class Board:
         rows = board_from_column_to_rows()
         for row in rows:
             for tile in row:
-                name_length = len(str(tile))
-                if not str(tile):
+                name_length = len(tile)
+                if not tile:
                     map_ += self.empty_repr
                 elif name_length == 1:
-                    map_ +=  " {0} ".format(str(tile))
+                    map_ +=  " {0} ".format(tile)
                 elif name_length == 2:
-                    map_ += " {0}".format(str(tile))
+                    map_ += " {0}".format(tile)
                 elif name_length == 3:
-                    map_ += "{0}".format(str(tile))
+                    map_ += "{0}".format(tile)
                 else:
-                    map_ += " {0} ".format(str(tile))
+                    map_ += " {0} ".format(tile)
 
             map_ += "\n"
         return map_
 
+    def _str_at(self, x, y):
+        """Return the string representation of the tile on x, y."""
+        terrain = self.terrain_at(x, y)
+        if terrain is not None:
+            return terrain.letter
+        return str(self.board[x][y])
+
+    def _x_range(self):
+        """The x coordinates which make up the board."""
+        return range(self.size_x)
+
+    def _y_range(self):
+        """The y coordinates which make up the board."""
+        return range(self.size_y)
+
     def __repr__(self):
         """Return the graphical representation of the map
         plus the classical python representation of an object.
@@ -164,7 +513,7 @@ class Board:
         return (str(self.board) + '\n ' +
                 ' Board Name: ' + self.name + '|' + super().__repr__())
 
-    def fill_board_with_blueprint(self, blueprint, legend):
+    def fill_board_with_blueprint(self, blueprint, legend, terrain=None):
         """Take a blueprint and a legend for it and fill the board
         according to them.
 
@@ -190,6 +539,10 @@ class Board:
                 to the right and then belown).
                 if legend[letter] is a nularry function that returns a Piece,
                 the piece returned by the nulary function will be put in place
+            terrain ({letter: Piece}): just like legend, but the pieces here
+                will be put on the terrain layer of the board. A single piece
+                will be shared by all the positions with that letter. See
+                :func:`~ludema.board.Board.put_terrain`.
 
         Raises:
             WrongeSizeOnX: if the blueprint doesn't have the correct width
@@ -231,11 +584,110 @@ class Board:
         if not all([len(line) == len(lines[0]) for line in lines]):
             raise RowsOfDifferentSizes
 
+        terrain = terrain or {}
+        terrain_placements, placements = [], []
         for y_position, string in enumerate(reversed(lines)):
             for x_position, letter in enumerate(string):
-                if letter in legend:
+                if letter in terrain:
+                    terrain_placements.append((terrain[letter], x_position, y_position))
+                elif letter in legend:
                     piece = utils.extract_pieces_from_possible_containers(legend[letter])
-                    self.put_piece(piece, x_position, y_position)
+                    placements.append((piece, x_position, y_position))
+        self.__put_batch(terrain_placements, placements)
+
+    def fill_board_with_arrays(self, codes, legend, terrain=None):
+        """Take an array of codes and a legend for it and fill the board
+        according to them. Works just like
+        :func:`~ludema.board.Board.fill_board_with_blueprint`, but with a
+        2D array of integers indexed as codes[x, y] instead of a string.
+        Positions with code 0 are left empty, and so are the ones whose code
+        is not on the legend. Only the non-empty positions are looked at.
+
+        The kinds array of :class:`~ludema.arrays.BoardArrays` is a valid
+        array of codes, which makes it easy to save and load boards.
+
+        Needs NumPy.
+
+        Args:
+            codes (2D array of ints): the codes of the pieces on the board
+            legend ({code: (Piece | [Piece] | nullary function -> Piece): just
+                like the legend of fill_board_with_blueprint, but with codes
+                instead of letters.
+            terrain ({code: Piece}): just like legend, but the pieces here
+                will be put on the terrain layer of the board.
+
+        Raises:
+            WrongeSizeOnX: if the array doesn't have the correct width
+            WrongSizeOnY: if the array doesn't have correct height
+            ImpossibleToExtractPiece: if something weird happened when
+                trying to excract a Piece from the legend
+        """
+        size_x, size_y = codes.shape
+        if size_x != self.size_x:
+            raise WrongSizeOnX
+        if size_y != self.size_y:
+            raise WrongSizeOnY
+
+        legend = utils.copy_lists_in_dictionary(legend)  # see fill_board_with_blueprint
+        terrain = terrain or {}
+        terrain_placements, placements = [], []
+        for x, y, code in codes_in(codes):
+            if code in terrain:
+                terrain_placements.append((terrain[code], x, y))
+            elif code in legend:
+                piece = utils.extract_pieces_from_possible_containers(legend[code])
+                placements.append((piece, x, y))
+        self.__put_batch(terrain_placements, placements)
+
+    def use_arrays(self):
+        """Start keeping NumPy arrays which describe the whole board.
+        From now on, the board will update them every time a piece is put,
+        removed or moved. See :class:`~ludema.arrays.BoardArrays`.
+
+        Needs NumPy.
+
+        Returns:
+            BoardArrays: the arrays, which you can also find as board.arrays
+        """
+        if self.arrays is None:
+            self.arrays = BoardArrays(self)
+        return self.arrays
+
+    def layer(self, name, default=0.0, dtype=float):
+        """Return the layer of numbers called name, creating it if it doesn't
+        exist yet. See :class:`~ludema.layers.Layer`.
+
+        Needs NumPy.
+
+        Args:
+            name (str): the name of the layer, like 'cost' or 'light'
+            default (number): the initial value of every position. Only used
+                when the layer is created.
+            dtype: the NumPy type of the values. Only used when the layer
+                is created.
+
+        Returns:
+            Layer: the layer
+        """
+        layer = self._layers.get(name)
+        if layer is None:
+            layer = self._layers[name] = Layer(self, name, default, dtype)
+        return layer
+
+    def remove_layer(self, name):
+        """Throw away the layer called name.
+
+        Returns:
+            Layer | None: the removed layer, if it existed
+        """
+        return self._layers.pop(name, None)
+
+    def _tile_changed(self, x, y):
+        """Let whatever keeps track of the contents of the tiles know that
+        the tile on x, y has changed.
+        """
+        if self.arrays is not None:
+            self.arrays.refresh(x, y)
 
     def put_piece(self, piece, x, y):
         """Puts a piece on the board.
@@ -249,23 +701,193 @@ class Board:
             OutOfBoardError: if (x,y) coordinates are not on board
             PositionOccupiedError: if position on (x,y) is already occupied and
                 that tile is not walkable
+
+        See also:
+            :func:`~ludema.board.Board.try_put`: the same, without exceptions.
         """
+        status = self.try_put(piece, x, y)
+        if status != Status.OK:
+            self.__raise_for(status, x, y)
 
-        position = Position(x, y)
-        try:
-            self.__try_moving_there(position)
-        except (OutOfBoardError, PositionOccupiedError):
-            raise
+    def try_put(self, piece, x, y):
+        """Puts a piece on the board if it can. Just like put_piece, but
+        it never raises an exception: it tells you what happened instead.
+        Cheaper than put_piece when you expect to fail often.
 
+        Args:
+            piece (Piece): the piece which shall be put into the board
+            x (int): The x coordinate where to put the piece.
+            y (int): the y coordinate where to put the piece.
+
+        Returns:
+            int: Status.OK if the piece was put, Status.OUT_OF_BOARD or
+            Status.OCCUPIED if it wasn't.
+        """
+        status = self.position_status(x, y)
+        if status == Status.OK:
+            self.__place(piece, self.board[x][y])
+        return status
+
+    def put_pieces(self, placements):
+        """Puts many pieces on the board at once.
+
+        All the positions are checked before putting any piece, so either
+        all of the pieces are put or none of them is. Pieces may be stacked
+        on the same position, as long as the ones below are walkable.
+
+        Args:
+            placements ([(Piece, int, int)]): the pieces to put and the x and y
+                coordinates where to put each one of them.
+
+        Raises:
+            OutOfBoardError: if any of the coordinates are not on board
+            PositionOccupiedError: if any of the positions is already occupied
+                by a piece which is not walkable
+        """
+        self.__put_batch([], placements)
+
+    def fill_rect(self, piece_constructor, x, y, width, height):
+        """Puts pieces returned by piece_constructor on every position of
+        a rectangle. Just like put_pieces, either all of them are put or none.
+
+        Args:
+            piece_constructor (nullary function): a function that returns the piece
+            x (int): the x coordinate of the bottom left corner of the rectangle
+            y (int): the y coordinate of the bottom left corner of the rectangle
+            width (int): how many columns the rectangle spans
+            height (int): how many rows the rectangle spans
+
+        Raises:
+            OutOfBoardError: if part of the rectangle is not on board
+            PositionOccupiedError: if any of the positions is already occupied
+                by a piece which is not walkable
+        """
+        self.put_pieces([(piece_constructor(), x_position, y_position)
+                         for x_position in range(x, x + width)
+                         for y_position in range(y, y + height)])
+
+    def __put_batch(self, terrain_placements, placements):
+        """Check all the placements given, and only if all of them are fine,
+        put the terrain and then the pieces on the board.
+
+        Args:
+            terrain_placements ([(Piece, int, int)]): terrain pieces and their coordinates
+            placements ([(Piece, int, int)]): pieces and their coordinates
+        """
+        terrain_placements, placements = list(terrain_placements), list(placements)
+        for piece in {id(piece): piece for piece, _, _ in terrain_placements}.values():
+            if piece.walkable:
+                raise WalkableTerrainError(piece)
+
+        tiles = []
+        tops = {}  # (x, y) -> the topmost piece after the batch is put
+        for piece, x, y in terrain_placements + placements:
+            if not self._is_valid_xy(x, y):
+                raise OutOfBoardError(self, Position(x, y))
+            tile = self.board[x][y]
+            top = tops[x, y] if (x, y) in tops else tile.piece
+            if top is not None and not top.walkable:
+                raise PositionOccupiedError(tile)
+            # terrain goes first, so only the pieces already there can be under it
+            if len(tiles) < len(terrain_placements) and tile.pieces:
+                raise PositionOccupiedError(tile)
+            tops[x, y] = piece
+            tiles.append(tile)
+
+        for piece, x, y in terrain_placements:
+            self.__set_terrain(piece, x, y)
+        for (piece, _, _), tile in zip(placements, tiles[len(terrain_placements):]):
+            self.__place(piece, tile)
+
+    def __place(self, piece, tile):
+        """Put piece on tile, without checking anything."""
         # NOTE: This is THE ONLY PLACE where we create the bidirectional, 1 to 1
         # relationship between a tile and a piece.
-        destinity_tile = self.board[position.x][position.y]
-        destinity_tile.piece = piece
+        tile.piece = piece
+        self.registry.add(piece)
+        x, y = tile.position
+        self.spatial.add(piece, x, y)
+        self._tile_changed(x, y)
+        if isinstance(piece, (pieces.NPC, pieces.Player)):
+            # on the same turn, NPCs act before players
+            self.scheduler.add(piece, group=isinstance(piece, pieces.Player))
+            # see if it's too far on the next turn. players are never frozen
+            if self._active is not None and isinstance(piece, pieces.NPC):
+                self._active[piece] = None
+
+    def pieces_of(self, piece_class):
+        """Return a read-only view of the pieces on the board which are
+        instances of piece_class, subclasses included. Takes constant time.
+        Terrain pieces are not included.
+
+        Args:
+            piece_class (type): a subclass of Piece
+
+        Returns:
+            A view of the pieces. Make a list out of it if you plan to add
+            or remove pieces from the board while iterating over it.
+        """
+        return self.registry.of_type(piece_class)
+
+    def pieces_within(self, x, y, radius, piece_class=Piece):
+        """Return a list of the pieces of piece_class at most radius positions
+        away from x, y, as the crow flies. Only looks at the part of the board
+        around x, y. Terrain pieces are not included.
+
+        Args:
+            x (int): the x coordinate of the center
+            y (int): the y coordinate of the center
+            radius (int | float): the maximum distance to the center
+            piece_class (type): only look for pieces of this class
+
+        Returns:
+            [Piece]: the pieces found, in no particular order
+        """
+        return self.spatial.within(x, y, radius, piece_class)
+
+    def tiles_in(self, stencil, x, y):
+        """Return a list of the tiles covered by stencil when centered on
+        x, y, leaving out the positions outside of the board. Bounds are
+        only checked tile by tile if the stencil sticks out of the board.
+
+        Args:
+            stencil (Stencil): the area, see :mod:`ludema.abstract.stencils`
+            x (int): the x coordinate of the center
+            y (int): the y coordinate of the center
 
-        if isinstance(piece, pieces.NPC):
-            self.npcs.append(piece)
-        elif isinstance(piece, pieces.Player):
-            self.players.append(piece)
+        Returns:
+            [Tile]: the tiles, in the order of the offsets of the stencil
+        """
+        board = self.board
+        if (self._is_valid_xy(x + stencil.min_dx, y + stencil.min_dy) and
+                self._is_valid_xy(x + stencil.max_dx, y + stencil.max_dy)):
+            return [board[x + dx][y + dy] for dx, dy in stencil.offsets]
+        is_valid = self._is_valid_xy
+        return [board[x + dx][y + dy] for dx, dy in stencil.offsets
+                if is_valid(x + dx, y + dy)]
+
+    def nearest_pieces(self, x, y, k=1, piece_class=Piece, max_radius=None):
+        """Return a list of the k pieces of piece_class nearest to x, y,
+        as the crow flies, closest first. Terrain pieces are not included.
+
+        Args:
+            x (int): the x coordinate of the center
+            y (int): the y coordinate of the center
+            k (int): how many pieces to look for
+            piece_class (type): only look for pieces of this class
+            max_radius (int | float | None): ignore pieces further away than
+                this. None means no limit.
+
+        Returns:
+            [Piece]: up to k pieces. Fewer if there aren't enough of them.
+        """
+        return self.spatial.nearest(x, y, k, piece_class, max_radius)
+
+    def piece_named(self, name):
+        """Return the piece on the board with the given name, or None if
+        there's no such piece.
+        """
+        return self.registry.named(name)
 
     def put_piece_on_column(self, piece_constructor, x, ranges):
         """Puts pieces returned by piece_constructor on the column
@@ -281,9 +903,9 @@ class Board:
         if not ranges:
             ranges = [(0, self.size_y)]
 
-        for begin, end in ranges:
-            for y in range(begin, end):
-                self.put_piece(piece_constructor(), x, y)
+        self.put_pieces([(piece_constructor(), x, y)
+                         for begin, end in ranges
+                         for y in range(begin, end)])
 
     def put_piece_on_row(self, piece_constructor, y, ranges):
         """Puts pieces returned by piece_constructor on the row of position Y.
@@ -296,11 +918,87 @@ class Board:
             ranges (*tuples): arbitrary amout of ranges to put the piece on the row
         """
         if not ranges:
-            ranges = [(0, self.size_y)]
+            ranges = [(0, self.size_x)]
+
+        self.put_pieces([(piece_constructor(), x, y)
+                         for begin, end in ranges
+                         for x in range(begin, end)])
+
+    def put_terrain(self, piece, x, y):
+        """Puts a piece on the terrain layer of the board.
 
-        for begin, end in ranges:
-            for x in range(begin, end):
-                self.put_piece(piece_constructor(), x, y)
+        The terrain layer is meant for pieces that never move nor do anything,
+        and that nothing can walk over, like walls. The very same piece can be
+        put on as many positions as you like: the board only keeps a small code
+        for each position. Tiles with terrain answer with the terrain piece
+        when asked for their piece, and no other piece can be put on them.
+
+        Keep in mind that terrain pieces don't have a home_tile, and that
+        their on_touch_do method is never called.
+
+        Args:
+            piece (Piece): the terrain piece. Must not be walkable.
+            x (int): The x coordinate where to put the piece.
+            y (int): the y coordinate where to put the piece.
+
+        Raises:
+            OutOfBoardError: if (x,y) coordinates are not on board
+            PositionOccupiedError: if there's already any piece on (x,y),
+                be it walkable or not, or terrain
+            WalkableTerrainError: if the piece is walkable
+            TooManyTerrainKinds: if the board already has 255 different
+                terrain pieces
+        """
+        if piece.walkable:
+            raise WalkableTerrainError(piece)
+        if not self._is_valid_xy(x, y):
+            raise OutOfBoardError(self, Position(x, y))
+        # terrain hides what's under it, so not even walkable pieces may be there
+        tile = self.board[x][y]
+        if tile.pieces:
+            raise PositionOccupiedError(tile)
+        self.__set_terrain(piece, x, y)
+
+    def __set_terrain(self, piece, x, y):
+        """Put piece on the terrain layer, without checking anything
+        but the amount of terrain pieces.
+        """
+        code = self._terrain_codes.get(piece)
+        if code is None:
+            code = len(self.terrain_kinds)
+            if code > 255:
+                raise TooManyTerrainKinds(self)
+            self.terrain_kinds.append(piece)
+            self._terrain_codes[piece] = code
+        self._set_terrain_code(x, y, code)
+        self._terrain_count += 1
+        self._tile_changed(x, y)
+
+    def remove_terrain(self, x, y):
+        """Removes the terrain piece on position x, y.
+
+        Args:
+            x (int): The x coordinate of the terrain
+            y (int): the y coordinate of the terrain
+
+        Returns:
+            Piece | None: the terrain piece which was there, if any
+        """
+        terrain = self.terrain_at(x, y)
+        if terrain is not None:
+            self._set_terrain_code(x, y, 0)
+            self._terrain_count -= 1
+            self._tile_changed(x, y)
+        return terrain
+
+    def terrain_at(self, x, y):
+        """Return the terrain piece on position x, y, or None if there's none.
+        Assumes that x, y is a valid position on the board.
+        """
+        return self.terrain_kinds[self._terrain[x * self.size_y + y]]
+
+    def _set_terrain_code(self, x, y, code):
+        self._terrain[x * self.size_y + y] = code
 
     def remove_piece(self, piece):
         """Removes an object from the map given its position.
@@ -313,43 +1011,104 @@ class Board:
             (int, int): the cordinates from where the piece was removed
 
         Raises:
-            PieceIsNotOnThisBoardError: if the piece.home_board is not this one
+            PieceIsNotOnThisBoardError: if the piece is not on a tile of this board
         """
 
-        if piece.home_board is not self:
+        home_tile = piece.home_tile
+        if home_tile is None or home_tile.board is not self:
             raise PieceIsNotOnThisBoardError(piece=piece, board=self)
 
-        self.put_piece(None, piece.position_x, piece.position_y)
+        # NOTE: we can't go through put_piece(None, ...) here: the tile
+        # is occupied by the very piece we want to remove, and the piece
+        # may not even be the topmost one on its tile.
+        home_tile._remove(piece)
+        piece.home_tile = None
+        self.registry.remove(piece)
+        self.spatial.remove(piece)
+        self.scheduler.remove(piece)
+        if self._active is not None:
+            self._active.pop(piece, None)
+        self._tile_changed(home_tile.position.x, home_tile.position.y)
+
+        return home_tile.position.x, home_tile.position.y
 
-        return piece.position_x, piece.position_y
+    def remove_pieces(self, pieces):
+        """Remove several pieces from the board at once.
+
+        Args:
+            pieces ([Piece]): the pieces to remove
+
+        Returns:
+            [(int, int)]: the coordinates from where each piece was removed
+
+        Raises:
+            PieceIsNotOnThisBoardError: if a piece is not on a tile of this
+                board. The pieces before it are removed anyway.
+        """
+        return [self.remove_piece(piece) for piece in pieces]
+
+    def release_pieces(self, prototypes):
+        """Remove every piece from the board, giving back to prototypes
+        the ones which were cloned from it, so the next boards can reuse them.
+        Terrain is left alone.
+
+        Args:
+            prototypes (PrototypeRegistry): the registry the pieces came from
+
+        Returns:
+            int: how many pieces were given back to prototypes
+        """
+        released = 0
+        for piece in self.registry:
+            self.remove_piece(piece)
+            released += prototypes.release(piece)
+        return released
+
+    def _relocate(self, piece, tile):
+        """Take piece from its tile and put it on tile, keeping the indexes of
+        the board up to date. No checks are made: that's the job of the
+        Moving interface of the pieces, which is the one who calls this.
+        """
+        old_position = piece.home_tile.position
+        piece.home_tile.piece = None
+        tile.piece = piece
+        self.spatial.move(piece, tile.position.x, tile.position.y)
+        self._tile_changed(old_position.x, old_position.y)
+        self._tile_changed(tile.position.x, tile.position.y)
 
     def get_adjacent_to_tile(self, tile):
-        """Return a dictionary of the form {DIRECTION: TILE or None}.
+        """Return a read-only mapping of the form {DIRECTION: TILE or None}.
         None will be the value only if the direction is outside of the map for
         the requested center tile.
 
+        The mapping is computed only once per tile and then cached, so
+        asking for the surroundings of a tile is cheap and you'll always
+        get the very same object back. Don't try to modify it.
+
         Args:
             tile (Tile): the 'center' tile, which surroundings we're looking for
 
         Returns:
             {Direction: Tile | None}: surroundings of the tile given as parameter
         """
-
-        position = tile.position
-        ideal_adjacent = {
-            Direction.UP: Position(position.x, position.y + 1),
-            Direction.RIGHT: Position(position.x + 1, position.y),
-            Direction.DOWN: Position(position.x, position.y - 1),
-            Direction.LEFT: Position(position.x - 1,  position.y)
-            }
-
+        surroundings = tile._surroundings
+        if surroundings is None:
+            surroundings = MappingProxyType(self._adjacent_to_position(tile.position))
+            tile._surroundings = surroundings
+        return surroundings
+
+    def _adjacent_to_position(self, position):
+        """Return a new dictionary of the form {DIRECTION: TILE or None}
+        for the tiles next to position.
+        """
+        x, y = position
         adjacent = {}
-        for direction, position in iter(ideal_adjacent.items()):
-            if self._is_valid_position(position):
-                adjacent[direction] = self.board[position.x][position.y]
+        for direction, (x_step, y_step) in Direction.STEPS.items():
+            adjacent_x, adjacent_y = x + x_step, y + y_step
+            if self._is_valid_xy(adjacent_x, adjacent_y):
+                adjacent[direction] = self.board[adjacent_x][adjacent_y]
             else:
                 adjacent[direction] = None
-
         return adjacent
 
     def column_on_position(self, x):
@@ -361,7 +1120,7 @@ class Board:
         Yields:
             The tiles on column x.
         """
-        for y in range(self.size_y):
+        for y in self._y_range():
             yield self.board[x][y]
 
     def row_on_postition(self, y):
@@ -373,7 +1132,7 @@ class Board:
         Yields:
             The tiles on row y.
         """
-        for x in range(self.size_x):
+        for x in self._x_range():
             yield self.board[x][y]
 
     def _is_valid_position(self, position):
@@ -384,65 +1143,52 @@ class Board:
         Returns:
             True if position inside the map, False if not
         """
-        try:
-            self.__check_position_inside_map(position)
-            valid_position = True
-        except OutOfBoardError:
-            valid_position = False
-        return valid_position
-
-    def __try_moving_there(self, position):
-        """Raises either a OutOfBoardError or a PositionOccupiedError
-        if the position given is out of the board or occupied.
-
-        Args:
-            position (Position): the position which we are insterested in
+        return self._is_valid_xy(position.x, position.y)
 
-        Raises:
-            OutOfBoardError: if the position is outside of this board
-            PositionOccupiedError: if the posision is already occupied
-        """
-        conditions = (self.__check_position_inside_map,
-                      self.__check_position_occupied)
-
-        for condition in conditions:
-            try:
-                condition(position)
-            except (OutOfBoardError, PositionOccupiedError) as e:
-                raise e
+    def _is_valid_xy(self, x, y):
+        """Same as _is_valid_position, but takes the coordinates directly."""
+        return 0 <= x < self.size_x and 0 <= y < self.size_y
 
-    def __check_position_inside_map(self, position):
-        """Return True if a given position is found within the limits
-        of the board.
+    def position_status(self, x, y):
+        """Tell whether a piece could be put on position x, y.
+        Never raises an exception.
 
         Args:
-            position (Position): the position to check
+            x (int): the x coordinate of the position
+            y (int): the y coordinate of the position
 
-        Raises:
-            OutOfBoardError: if posisition is out of this board
+        Returns:
+            int: Status.OK if a piece could be put there, Status.OUT_OF_BOARD
+            if the position is outside of the board and Status.OCCUPIED if
+            there's already a piece there which is not walkable.
         """
-        x_pos, y_pos = abs(position.x), abs(position.y)
-        if self.size_y <= y_pos or self.size_x <= x_pos:
-            raise OutOfBoardError(self, position)
+        if not self._is_valid_xy(x, y):
+            return Status.OUT_OF_BOARD
+        piece = self.board[x][y].piece
+        if piece is not None and not piece.walkable:
+            return Status.OCCUPIED
+        return Status.OK
 
-    def __check_position_occupied(self, position):
-        """Return True if a given position if already occupied by other
-        object.
-
-        Args:
-            position (Position): the position to check
+    def __raise_for(self, status, x, y):
+        """Raise the exception which corresponds to the status given
+        for the position x, y.
 
         Raises:
-            PositionOccupiedError: if posisition is already occupied
+            OutOfBoardError: if the status is Status.OUT_OF_BOARD
+            PositionOccupiedError: if the status is Status.OCCUPIED
         """
-        tile = self.board[position.x][position.y]
-        if tile.piece is not None and not tile.piece.walkable:
-            raise PositionOccupiedError(tile)
+        if status == Status.OUT_OF_BOARD:
+            raise OutOfBoardError(self, Position(x, y))
+        if status == Status.OCCUPIED:
+            raise PositionOccupiedError(self.board[x][y])
 
 
 class Tile:
     """A tile is the atomic unit of the Board.
     """
+    __slots__ = ('board', 'position', '_piece', '_beneath', '_surroundings',
+                 '__weakref__')
+
     def __init__(self, board, position, piece=None):
         """
         Every tile lives on a board and has a position there.
@@ -459,27 +1205,114 @@ class Tile:
         """
         self.board = board
         self.position = position
-        self._piece_stack = [piece]
+        self._piece = piece  # the topmost piece
+        # the pieces below the topmost one, from the bottom up. only
+        # a list when there are any, as most tiles hold one piece at most.
+        self._beneath = None
+        self._surroundings = None
 
     @property
     def piece(self):
         """The piece property returns the topmost piece on a tile (as tiles
-        may hold several pieces).
+        may hold several pieces), or the terrain piece of the tile if it has one.
 
         Setting the tile's piece to None will **remove** and
-        return the topmost piece.
+        return the topmost piece. Terrain can't be removed this way.
         """
-        return self._piece_stack[-1]
+        piece = self._piece
+        if piece is None and self.board._terrain_count:
+            return self.terrain
+        return piece
 
     @piece.setter
     def piece(self, piece):
-        # if we currently have no piece or it is walkable, just change the topmost
-        if self.piece is None or self.piece.walkable:
-            self._piece_stack.append(piece)
-            piece.home_tile = self
         # we interpret the 'None' type as removing a piece from the tile
         if piece is None:
-            self._piece_stack.pop()
+            self._pop()
+            return
+        # if we currently have no piece or it is walkable, just change the topmost
+        top = self.piece
+        if top is None or top.walkable:
+            self._push(piece)
+            piece.home_tile = self
+
+    @property
+    def pieces(self):
+        """A tuple with all the pieces on the tile, from the bottom up.
+        The last one is the one you get with Tile.piece. Has no setter.
+        """
+        if self._piece is None:
+            terrain = self.terrain if self.board._terrain_count else None
+            return () if terrain is None else (terrain,)
+        if self._beneath is None:
+            return (self._piece,)
+        return tuple(self._beneath) + (self._piece,)
+
+    def piece_under(self, piece=None):
+        """Return the piece right below piece on this tile, or None if
+        there's nothing below it. Takes constant time for the topmost piece.
+
+        Args:
+            piece (Piece | None): the piece we want to look under.
+                None means the topmost piece of the tile.
+
+        Raises:
+            ValueError: if piece is not on this tile
+        """
+        if piece is None or piece is self._piece:
+            return self._beneath[-1] if self._beneath else None
+        pieces = self.pieces
+        index = pieces.index(piece)
+        return pieces[index - 1] if index else None
+
+    @property
+    def terrain(self):
+        """The terrain piece of the tile, None if it has no terrain."""
+        return self.board.terrain_at(self.position.x, self.position.y)
+
+    def layer(self, name):
+        """Return the value of the layer called name on this tile.
+        See :func:`~ludema.board.Board.layer`.
+
+        Raises:
+            KeyError: if the board has no layer with that name
+        """
+        return self.board._layers[name].value_at(self.position.x, self.position.y)
+
+    def _push(self, piece):
+        """Put piece on top of the others, without checking anything."""
+        if self._piece is not None:
+            if self._beneath is None:
+                self._beneath = [self._piece]
+            else:
+                self._beneath.append(self._piece)
+        self._piece = piece
+
+    def _pop(self):
+        """Remove the topmost piece, if there's one, and return it."""
+        top = self._piece
+        if self._beneath:
+            self._piece = self._beneath.pop()
+            if not self._beneath:
+                self._beneath = None
+        else:
+            self._piece = None
+        return top
+
+    def _remove(self, piece):
+        """Remove piece from the tile, be it the topmost one or not.
+
+        Raises:
+            ValueError: if piece is not on this tile
+        """
+        if piece is not None and piece is self._piece:
+            self._pop()
+        elif self._beneath and piece in self._beneath:
+            self._beneath.remove(piece)
+            if not self._beneath:
+                self._beneath = None
+        else:
+            raise ValueError("piece is not on this tile")
 
     def __repr__(self):
         original = super().__repr__()
@@ -490,3 +1323,425 @@ class Tile:
 
     def __str__(self):
         return self.piece.letter if self.piece else ""
+
+
+class _CompactGrid:
+    """Stands in for the list of columns of a Board created with compact=True.
+
+    Instead of holding one Tile per position, it keeps the id of the topmost
+    piece of every position on a flat array, and creates Tiles only when
+    someone asks for them. As long as someone (usually a piece) holds
+    a reference to one of those Tiles, asking for the same position again
+    returns that very same Tile.
+    """
+    def __init__(self, board, size_x, size_y):
+        self.board = board
+        self.size_x = size_x
+        self.size_y = size_y
+        # positions are stored column by column, just like the normal board
+        self.cells = array('L', [0]) * (size_x * size_y)
+        self.beneath = {}  # cell index -> ids of pieces below the topmost one
+        self.pieces = [None]  # piece id -> piece. id 0 means no piece.
+        self.ids = {}  # piece -> piece id
+        self.free_ids = []
+        self.tiles = weakref.WeakValueDictionary()
+
+    def __len__(self):
+        return self.size_x
+
+    def __getitem__(self, x):
+        if x < 0:
+            x += self.size_x
+        if not 0 <= x < self.size_x:
+            raise IndexError("board column out of range")
+        return _CompactColumn(self, x)
+
+    def __iter__(self):
+        for x in range(self.size_x):
+            yield _CompactColumn(self, x)
+
+    def tile(self, x, y):
+        """Return the Tile on position x, y, creating it if necessary."""
+        index = x * self.size_y + y
+        tile = self.tiles.get(index)
+        if tile is None:
+            tile = _TileView(self.board, Position(x, y), self, index)
+            self.tiles[index] = tile
+        return tile
+
+    def top(self, index):
+        return self.pieces[self.cells[index]]
+
+    def stack(self, index):
+        """Return the pieces on cell index, from the bottom to the top."""
+        ids = self.beneath.get(index, []) + [self.cells[index]]
+        return [self.pieces[id_] for id_ in ids if id_]
+
+    def push(self, index, piece):
+        below = self.cells[index]
+        if below:
+            self.beneath.setdefault(index, []).append(below)
+        self.cells[index] = self._id_for(piece)
+
+    def remove(self, index, piece):
+        """Remove piece from the cell on index. Raises ValueError if the
+        piece is not there, like list.remove would.
+        """
+        id_ = self.ids.get(piece)
+        below = self.beneath.get(index, [])
+        if id_ is None:
+            raise ValueError("piece is not on this cell")
+        if self.cells[index] == id_:
+            self.cells[index] = below.pop() if below else 0
+        elif id_ in below:
+            below.remove(id_)
+        else:
+            raise ValueError("piece is not on this cell")
+        if index in self.beneath and not below:
+            del self.beneath[index]
+        self._release(piece)
+
+    def _id_for(self, piece):
+        if self.free_ids:
+            id_ = self.free_ids.pop()
+            self.pieces[id_] = piece
+        else:
+            id_ = len(self.pieces)
+            self.pieces.append(piece)
+        self.ids[piece] = id_
+        return id_
+
+    def _release(self, piece):
+        id_ = self.ids.pop(piece)
+        self.pieces[id_] = None
+        self.free_ids.append(id_)
+
+
+class _CompactColumn:
+    """A column of a _CompactGrid. Behaves like the lists of Tiles that
+    make up the columns of a normal Board.
+    """
+    __slots__ = ('grid', 'x')
+
+    def __init__(self, grid, x):
+        self.grid = grid
+        self.x = x
+
+    def __len__(self):
+        return self.grid.size_y
+
+    def __getitem__(self, y):
+        if y < 0:
+            y += self.grid.size_y
+        if not 0 <= y < self.grid.size_y:
+            raise IndexError("board row out of range")
+        return self.grid.tile(self.x, y)
+
+    def __iter__(self):
+        for y in range(self.grid.size_y):
+            yield self.grid.tile(self.x, y)
+
+
+class _TileView(Tile):
+    """A Tile which doesn't hold its pieces but reads and writes them
+    from a _CompactGrid.
+    """
+    __slots__ = ('_grid', '_index')
+
+    def __init__(self, board, position, grid, index):
+        self.board = board
+        self.position = position
+        self._surroundings = None
+        self._grid = grid
+        self._index = index
+
+    def _get_piece(self):
+        piece = self._grid.top(self._index)
+        if piece is None and self.board._terrain_count:
+            return self.terrain
+        return piece
+
+    piece = property(_get_piece, Tile.piece.fset, doc=Tile.piece.__doc__)
+
+    @property
+    def pieces(self):
+        pieces = self._grid.stack(self._index)
+        if not pieces and self.board._terrain_count and self.terrain is not None:
+            pieces = [self.terrain]
+        return tuple(pieces)
+
+    pieces.__doc__ = Tile.pieces.__doc__
+
+    def piece_under(self, piece=None):
+        below = self._grid.beneath.get(self._index)
+        if piece is None or piece is self._grid.top(self._index):
+            return self._grid.pieces[below[-1]] if below else None
+        pieces = self.pieces
+        index = pieces.index(piece)
+        return pieces[index - 1] if index else None
+
+    def _push(self, piece):
+        self._grid.push(self._index, piece)
+
+    def _pop(self):
+        top = self._grid.top(self._index)
+        if top is not None:
+            self._grid.remove(self._index, top)
+        return top
+
+    def _remove(self, piece):
+        self._grid.remove(self._index, piece)
+
+    def __eq__(self, other):
+        if not isinstance(other, _TileView):
+            return NotImplemented
+        return self._grid is other._grid and self._index == other._index
+
+    def __hash__(self):
+        return hash((id(self._grid), self._index))
+
+
+class ChunkedBoard(Board):
+    """A Board which doesn't create all of its tiles when it is created.
+    Tiles are created in square chunks, only once a piece is put on them or
+    someone asks for them. Chunks which hold no pieces, and aren't next to
+    a chunk which does, are thrown away at the end of every turn, or
+    whenever you call
+    :func:`~ludema.board.ChunkedBoard.evict_empty_chunks`.
+
+    Chunked boards may be unbounded on any of its axes: just pass None as
+    its size. Unbounded axes also accept negative coordinates.
+    """
+    def __init__(self, name, size_x, size_y, win_conditions, lose_conditions,
+                 empty_repr="   ", turn_limit=-1, compact=True, chunk_size=16):
+        """
+        Args:
+            name (str): the name of the board
+            size_x (int | None): the horizontal size of the board. None
+                for an horizontally unbounded board.
+            size_y (int | None): the vertical size of the board. None
+                for a vertically unbounded board.
+            win_conditions ([nullary functions]): each turn will be evaluated, if
+                ONE returns True, the board is WON
+            lose_condtitions ([nullary functions]): idem win_conditions, but if ONE
+                returns True, the board is considered lost
+            empty_repr (str): what should an empty espace be represented as?.
+            turn_limit: (int): if turn limit is passed, raise TurnsAreOver error.
+                any negative number will be interpreted as no turn limit.
+            compact (bool): ignored, a chunked board is always compact.
+                Only here so new_from_blueprint works with chunked boards too.
+            chunk_size (int): the width and height of each chunk of tiles.
+        """
+        self.chunk_size = chunk_size
+        Board.__init__(self, name, size_x, size_y, win_conditions,
+                       lose_conditions, empty_repr, turn_limit, compact=True)
+
+    def _create_board(self, size_x, size_y):
+        return _ChunkGrid(self, self.chunk_size)
+
+    def _create_terrain(self, size_x, size_y):
+        return {}  # (x, y) -> terrain code. we can't know how big the board is
+
+    def terrain_at(self, x, y):
+        return self.terrain_kinds[self._terrain.get((x, y), 0)]
+
+    def _set_terrain_code(self, x, y, code):
+        if code:
+            self._terrain[x, y] = code
+        else:
+            self._terrain.pop((x, y), None)
+
+    def _pass_turn(self):
+        Board._pass_turn(self)
+        self.evict_empty_chunks()
+
+    def evict_empty_chunks(self):
+        """Throw away all the chunks that don't hold any piece, but for the
+        ones next to chunks which do: the pieces there would need them
+        again as soon as they look around.
+
+        Returns:
+            int: how many chunks were evicted
+        """
+        return self.board.evict_empty()
+
+    def _is_valid_xy(self, x, y):
+        return ((self.size_x is None or 0 <= x < self.size_x) and
+                (self.size_y is None or 0 <= y < self.size_y))
+
+    def _str_at(self, x, y):
+        terrain = self.terrain_at(x, y)
+        if terrain is not None:
+            return terrain.letter
+        # don't create chunks just to print them
+        tile = self.board.peek(x, y)
+        return str(tile) if tile is not None else ""
+
+    def _x_range(self):
+        if self.size_x is not None:
+            return range(self.size_x)
+        return self.board.occupied_range(axis=0)
+
+    def _y_range(self):
+        if self.size_y is not None:
+            return range(self.size_y)
+        return self.board.occupied_range(axis=1)
+
+
+class _Chunk:
+    """A square of tiles of a ChunkedBoard."""
+    __slots__ = ('key', 'columns', 'population')
+
+    def __init__(self, board, key, chunk_size):
+        self.key = key
+        self.population = 0  # how many pieces there are on the chunk
+        x_0, y_0 = key[0] * chunk_size, key[1] * chunk_size
+        self.columns = [[_ChunkTile(board, Position(x_0 + x, y_0 + y), self)
+                         for y in range(chunk_size)]
+                        for x in range(chunk_size)]
+
+
+class _ChunkGrid:
+    """Stands in for the list of columns of a ChunkedBoard."""
+    def __init__(self, board, chunk_size):
+        self.board = board
+        self.chunk_size = chunk_size
+        self.chunks = {}  # (chunk_x, chunk_y) -> _Chunk
+        self.empty = set()  # keys of the chunks without pieces
+
+    def __len__(self):
+        if self.board.size_x is None:
+            raise TypeError("an horizontally unbounded board has no length")
+        return self.board.size_x
+
+    def __getitem__(self, x):
+        size_x = self.board.size_x
+        if size_x is not None and not 0 <= x < size_x:
+            raise IndexError("board column out of range")
+        return _ChunkedColumn(self, x)
+
+    def __iter__(self):
+        for x in self.board._x_range():
+            yield _ChunkedColumn(self, x)
+
+    def tile(self, x, y):
+        """Return the Tile on position x, y, creating its chunk if necessary."""
+        size = self.chunk_size
+        key = (x // size, y // size)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            chunk = self.chunks[key] = _Chunk(self.board, key, size)
+            self.empty.add(key)
+        return chunk.columns[x % size][y % size]
+
+    def peek(self, x, y):
+        """Return the Tile on position x, y if its chunk exists, None otherwise."""
+        size = self.chunk_size
+        chunk = self.chunks.get((x // size, y // size))
+        return chunk.columns[x % size][y % size] if chunk is not None else None
+
+    def population_changed(self, chunk, difference):
+        chunk.population += difference
+        if chunk.population:
+            self.empty.discard(chunk.key)
+        else:
+            self.empty.add(chunk.key)
+
+    def occupied_range(self, axis):
+        """Return the range of coordinates on axis (0 for x, 1 for y)
+        covered by the chunks holding pieces or terrain.
+        """
+        keys = [key[axis] for key, chunk in self.chunks.items() if chunk.population]
+        # terrain doesn't live on the chunks, which may not even exist
+        keys.extend(position[axis] // self.chunk_size for position in self.board._terrain)
+        if not keys:
+            return range(0)
+        return range(min(keys) * self.chunk_size, (max(keys) + 1) * self.chunk_size)
+
+    def evict_empty(self):
+        evicted = 0
+        kept = set()
+        for key in self.empty:
+            if key not in self.chunks:
+                continue
+            # the tiles on the border of a chunk with pieces have the tiles
+            # of the chunks next to it on their surroundings, so those chunks
+            # would be created again as soon as a piece there moves
+            if self.__has_populated_neighbour(key):
+                kept.add(key)
+                continue
+            del self.chunks[key]
+            self.__forget_neighbours_of(key)
+            evicted += 1
+        self.empty = kept  # look at them again on the next eviction
+        return evicted
+
+    def __has_populated_neighbour(self, key):
+        for x_step, y_step in Direction.STEPS.values():
+            neighbour = self.chunks.get((key[0] + x_step, key[1] + y_step))
+            if neighbour is not None and neighbour.population:
+                return True
+        return False
+
+    def __forget_neighbours_of(self, key):
+        """The tiles on the border of the chunks around an evicted chunk
+        have its tiles on their cached surroundings. Make them forget.
+        """
+        last = self.chunk_size - 1
+        for direction, (x_step, y_step) in Direction.STEPS.items():
+            neighbour = self.chunks.get((key[0] + x_step, key[1] + y_step))
+            if neighbour is None:
+                continue
+            if x_step:
+                border = neighbour.columns[last if x_step < 0 else 0]
+            else:
+                border = [column[last if y_step < 0 else 0] for column in neighbour.columns]
+            for tile in border:
+                tile._surroundings = None
+
+
+class _ChunkedColumn:
+    """A column of a _ChunkGrid. Behaves like the lists of Tiles that
+    make up the columns of a normal Board.
+    """
+    __slots__ = ('grid', 'x')
+
+    def __init__(self, grid, x):
+        self.grid = grid
+        self.x = x
+
+    def __len__(self):
+        return len(self.grid.board._y_range())
+
+    def __getitem__(self, y):
+        size_y = self.grid.board.size_y
+        if size_y is not None and not 0 <= y < size_y:
+            raise IndexError("board row out of range")
+        return self.grid.tile(self.x, y)
+
+    def __iter__(self):
+        for y in self.grid.board._y_range():
+            yield self.grid.tile(self.x, y)
+
+
+class _ChunkTile(Tile):
+    """A Tile which lets its chunk know how many pieces it holds."""
+    __slots__ = ('_chunk',)
+
+    def __init__(self, board, position, chunk):
+        Tile.__init__(self, board, position)
+        self._chunk = chunk
+
+    def _push(self, piece):
+        Tile._push(self, piece)
+        self.board.board.population_changed(self._chunk, 1)
+
+    def _pop(self):
+        top = Tile._pop(self)
+        if top is not None:
+            self.board.board.population_changed(self._chunk, -1)
+        return top
+
+    def _remove(self, piece):
+        Tile._remove(self, piece)
+        self.board.board.population_changed(self._chunk, -1)
@@ -0,0 +1,86 @@
+from ludema import pieces
+
+"""
+The purpose of this module is to deal the damage of the attacks made on
+a board, and to take the pieces killed by them out of it.
+"""
+
+
+class Combat:
+    """Deals the damage of the attacks made on a board, and takes the dead
+    pieces out of it when a turn ends.
+
+    Attacks can be dealt right away, or batched: queued during the turn
+    and dealt all at once at its end, as if they all happened at the same
+    time. Either way, the pieces killed are removed from the board at the
+    end of the turn, all together, so they don't take any more turns.
+    Only pieces with an is_dead property, like Characters, can die.
+    Characters are reaped however they die, be it by an attack, an item
+    or a timer, as they tell the combat whenever their health changes.
+    Players are the exception: dead players don't act, but are left on
+    the board, so games can still look at them to tell they lost.
+
+    Note:
+        Boards create their combat by themselves. Set board.combat.batched
+        to True if you want the attacks batched.
+    """
+    def __init__(self, board, batched=False):
+        """
+        Args:
+            board (Board): the board where the fights happen
+            batched (bool): queue the attacks until the turn ends
+        """
+        self.board = board
+        self.batched = batched
+        self._pending = []  # (piece, damage) waiting for the end of the turn
+        # pieces hurt since the last time the dead were taken out, as an ordered set
+        self._wounded = {}
+
+    def __len__(self):
+        """How many attacks are waiting for the end of the turn."""
+        return len(self._pending)
+
+    def hit(self, piece, damage):
+        """Hurt piece by damage, now or at the end of the turn if the
+        combat is batched. Simultaneous boards batch the attacks made
+        while a turn passes anyway, so no one dies before the others act.
+        """
+        if self.batched or self.board._intents is not None:
+            self._pending.append((piece, damage))
+        else:
+            piece.health -= damage
+            self._wounded[piece] = None
+
+    def hurt(self, piece):
+        """Remember piece was hurt without an attack, so it's taken out of
+        the board at the end of the turn if it died. Characters call this
+        by themselves when their health changes.
+        """
+        self._wounded[piece] = None
+
+    def resolve(self):
+        """Deal the damage of all the attacks waiting for the end of the
+        turn, adding up the damage each piece takes, and take the dead out
+        of the board. Boards call this every time a turn passes.
+
+        Returns:
+            [Piece]: the pieces which died and were removed from the board.
+            Dead players are left on it, and are not on the list.
+        """
+        wounded, self._wounded = self._wounded, {}
+        if self._pending:
+            damages = {}
+            for piece, damage in self._pending:
+                damages[piece] = damages.get(piece, 0) + damage
+            self._pending = []
+            for piece, damage in damages.items():
+                piece.health -= damage
+                wounded[piece] = None
+
+        registry = self.board.registry
+        dead = [piece for piece in wounded
+                if piece in registry and getattr(piece, 'is_dead', False)
+                and not isinstance(piece, pieces.Player)]
+        if dead:
+            self.board.remove_pieces(dead)
+        return dead
@@ -47,15 +47,15 @@ class TileIsEmptyError(_GameError):
             self.error_string = ("The Character {0} tried to attack tile {1}, "
                                  "but that tile does not have a character."
                                  .format(self.character, self.tile))
-        return error_string
+        return self.error_string
 
 class NotGrabbableError(_GameError):
-    def __init__(self, character, tile, error_string=None):
+    def __init__(self, piece):
         _GameError.__init__(self)
         self.piece = piece
 
     def __str__(self):
-        return "The piece {0} doesn't implement the grab method".format(self.piece)
+        return "The piece {0} can't be grabbed".format(self.piece)
 
 class NoItemToGrab(_GameError):
     def __init__(self, character):
@@ -64,6 +64,7 @@ class NoItemToGrab(_GameError):
     def __str__(self):
         error_string = ("The Character {0} tried to grab an item, "
                         "but no item was found.".format(self.character))
+        return error_string
 
 class PieceDoesNotHaveItemError(_GameError):
     def __init__(self, piece, item):
@@ -94,6 +95,7 @@ class PieceIsNotOnATileError(BoardError):
 class PieceIsNotOnThisBoardError(BoardError):
     def __init__(self, piece, board):
         BoardError.__init__(self)
+        self.piece = piece
         self.board = board
 
     def __str__(self):
@@ -127,6 +129,24 @@ class PositionOccupiedError(BoardError):
                         self.tile.board.name))
         return error_string
 
+class WalkableTerrainError(BoardError):
+    def __init__(self, piece):
+        BoardError.__init__(self)
+        self.piece = piece
+
+    def __str__(self):
+        return ("The piece {0} is walkable and thus can't be "
+                "put on the terrain layer of a board.".format(self.piece))
+
+class TooManyTerrainKinds(BoardError):
+    def __init__(self, board):
+        BoardError.__init__(self)
+        self.board = board
+
+    def __str__(self):
+        return ("The board {0} already has 255 different terrain pieces. "
+                "Try sharing the same piece among positions.".format(self.board.name))
+
 class BoardConstructionError(BoardError):
     def __init__(self):
         BoardError.__init__(self)
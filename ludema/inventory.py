@@ -0,0 +1,139 @@
+from ludema.utils import piece_classes, discard_from_index
+
+"""
+The purpose of this module is to let characters carry lots of items and
+still find, use and drop them in constant time.
+"""
+
+
+class Inventory:
+    """The items carried by a character, indexed by identity, class and name.
+
+    Items of the same class with the same name, like a bunch of potions or
+    arrows, make up a stack: you can ask how many there are and take any
+    of them without caring which.
+
+    All operations but indexing with a number take constant time. It can be
+    used as the list Character.items used to be: it can be iterated, in the
+    order the items were added, and it has append, remove, len and in.
+    An item can't be twice on an inventory, though.
+    """
+    def __init__(self, items=None):
+        """
+        Args:
+            items ([Item] | None): the items to start with
+        """
+        # item -> its stack key, as it was when added, as names may change
+        self._items = {}
+        # these map to ordered sets of items, see utils.discard_from_index
+        self._by_class = {}
+        self._by_name = {}
+        self._stacks = {}  # (class, name) -> the items in the stack
+        for item in items or ():
+            self.add(item)
+
+    def __contains__(self, item):
+        return item in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+    def __bool__(self):
+        return bool(self._items)
+
+    def __iter__(self):
+        return iter(list(self._items))
+
+    def __getitem__(self, index):
+        """Takes linear time: only here so old code using lists works."""
+        return list(self._items)[index]
+
+    def __repr__(self):
+        return "Inventory({0})".format(list(self._items))
+
+    def add(self, item):
+        """Put item on the inventory. Nothing happens if it was already there."""
+        if item in self._items:
+            return
+        key = self._items[item] = self.__stack_key(item)
+        self._stacks.setdefault(key, {})[item] = None
+        self._by_name.setdefault(key[1], {})[item] = None
+        for class_ in piece_classes(item):
+            self._by_class.setdefault(class_, {})[item] = None
+
+    append = add
+
+    def extend(self, items):
+        """Put all the items on the inventory."""
+        for item in items:
+            self.add(item)
+
+    def remove(self, item):
+        """Take item out of the inventory.
+
+        Raises:
+            ValueError: if item is not on the inventory
+        """
+        if item not in self._items:
+            raise ValueError("item is not on the inventory")
+        self.discard(item)
+
+    def discard(self, item):
+        """Take item out of the inventory, if it's there."""
+        if item not in self._items:
+            return
+        key = self._items.pop(item)
+        discard_from_index(self._stacks, key, item)
+        discard_from_index(self._by_name, key[1], item)
+        for class_ in piece_classes(item):
+            discard_from_index(self._by_class, class_, item)
+
+    def clear(self):
+        """Empty the inventory."""
+        self._items.clear()
+        self._by_class.clear()
+        self._by_name.clear()
+        self._stacks.clear()
+
+    def copy(self):
+        """Return a new inventory holding the same items."""
+        return Inventory(self._items)
+
+    def of_type(self, class_):
+        """Return a read-only view of the items which are instances of class_."""
+        return self._by_class.get(class_, {}).keys()
+
+    def named(self, name):
+        """Return a read-only view of the items called name, whatever their class."""
+        return self._by_name.get(name, {}).keys()
+
+    def stack_of(self, item):
+        """Return a read-only view of the items identical to item, that is,
+        of its same class and with its same name. item itself is included
+        if it's on the inventory.
+        """
+        return self._stacks.get(self.__stack_key(item), {}).keys()
+
+    def count(self, item):
+        """Return how many items identical to item there are on the inventory."""
+        return len(self._stacks.get(self.__stack_key(item), ()))
+
+    def stacks(self):
+        """Return a {(class, name): how many} dictionary of all the stacks."""
+        return {key: len(stack) for key, stack in self._stacks.items()}
+
+    def take(self, item):
+        """Take out of the inventory and return an item identical to item,
+        the last one added. None if there's none. Useful for things like
+        'drink a potion', when any potion does.
+        """
+        stack = self._stacks.get(self.__stack_key(item))
+        if not stack:
+            return None
+        taken = next(reversed(stack))
+        self.discard(taken)
+        return taken
+
+    @staticmethod
+    def __stack_key(item):
+        return type(item), item.name
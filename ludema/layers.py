@@ -0,0 +1,103 @@
+from ludema.arrays import numpy, _require_numpy
+
+"""
+The purpose of this module is to let boards hold numbers for each of their
+positions, like how much it costs to walk over them or how dark they are,
+and to update them for the whole board at once.
+"""
+
+
+class Layer:
+    """A named number for every position of a board, backed by a NumPy array
+    indexed as values[x, y].
+
+    Use :func:`~ludema.board.Board.layer` to get one, and
+    :func:`~ludema.board.Tile.layer` to read it tile by tile.
+
+    Every method which takes a where argument accepts a boolean array with
+    the shape of the board, like the masks of :class:`~ludema.arrays.BoardArrays`.
+    Only the positions where it is True are updated.
+    """
+    def __init__(self, board, name, default=0.0, dtype=float):
+        """
+        Args:
+            board (Board): the board the layer belongs to
+            name (str): the name of the layer
+            default (number): the initial value of every position
+            dtype: the NumPy type of the values
+        """
+        _require_numpy()
+        if board.size_x is None or board.size_y is None:
+            raise ValueError("Unbounded boards can't have layers.")
+        self.board = board
+        self.name = name
+        self.values = numpy.full((board.size_x, board.size_y), default, dtype=dtype)
+
+    def __getitem__(self, position):
+        return self.values[position]
+
+    def __setitem__(self, position, value):
+        self.values[position] = value
+
+    def value_at(self, x, y):
+        """Return the value on x, y as a plain python number."""
+        return self.values.item(x, y)
+
+    def fill(self, value):
+        """Set every position to value."""
+        self.values.fill(value)
+
+    def assign(self, value, where=None):
+        """Set the positions where the mask is True to value, which may be
+        a number or an array with the shape of the board.
+        """
+        if where is None:
+            self.values[...] = value
+        else:
+            self.values[where] = value if numpy.ndim(value) == 0 else value[where]
+
+    def add(self, value, where=None):
+        """Add value, a number or an array with the shape of the board,
+        to the positions where the mask is True.
+        """
+        if where is None:
+            self.values += value
+        else:
+            self.values[where] += value if numpy.ndim(value) == 0 else value[where]
+
+    def decay(self, factor, where=None):
+        """Multiply the positions where the mask is True by factor.
+        A factor of 0.9 takes away a tenth of the value every time.
+        """
+        if where is None:
+            self.values *= factor
+        else:
+            self.values[where] *= factor
+
+    def diffuse(self, rate, where=None):
+        """Let the values spread to their four neighbours, like heat does.
+
+        Each position moves rate of the way towards the mean of its neighbours.
+        Nothing flows through the borders of the board nor through the
+        positions where the mask is False, which keep their values.
+
+        Args:
+            rate (float): between 0 (nothing moves) and 1
+            where (boolean array | None): the positions which take part on
+                the diffusion. None for all of them.
+        """
+        values = self.values
+        if where is None:
+            where = numpy.ones(values.shape, dtype=bool)
+        padded = numpy.pad(values, 1)
+        padded_where = numpy.pad(where, 1, constant_values=False)
+        neighbours = numpy.zeros(values.shape, dtype=float)
+        for x_slice, y_slice in ((slice(2, None), slice(1, -1)),
+                                 (slice(None, -2), slice(1, -1)),
+                                 (slice(1, -1), slice(2, None)),
+                                 (slice(1, -1), slice(None, -2))):
+            # a neighbour which can't take part counts as a copy of the position
+            neighbours += numpy.where(padded_where[x_slice, y_slice],
+                                      padded[x_slice, y_slice], values)
+        diffused = values + rate * (neighbours / 4 - values)
+        values[where] = diffused[where]
@@ -1,13 +1,17 @@
+import inspect
 import random
 from functools import wraps
 from ludema.abstract.piece import Piece
-from ludema.abstract.actions import Action
 from ludema.abstract.utils import Direction
+from ludema.abstract.stencils import diamond
+from ludema.inventory import Inventory
 from ludema.exceptions import (PieceDoesNotHaveItemError, PieceIsNotOnATileError,
                                PieceIsNotOnThisBoardError, OutOfBoardError,
                                PositionOccupiedError, NoItemToGrab)
 
 class Wall(Piece):
+    __slots__ = ()
+
     def __init__(self, letter="."):
         """A very simple piece to represent walls.
 
@@ -17,6 +21,8 @@ class Wall(Piece):
         Piece.__init__(self, letter)
 
 class Item(Piece):
+    __slots__ = ('owner',)
+
     def __init__(self, letter, name, owner=None):
         """A class to represent items which can be owned and used by players
         and NPCs alike. It's intended to be subclassed as to define their action.
@@ -47,6 +53,11 @@ class Item(Piece):
         raise NotImplementedError("Every item should have its own do_action method!")
 
 class ShortRangeItem(Item):
+    __slots__ = ()
+    # the area the item affects, around its owner or itself. Subclasses
+    # may pick another one from ludema.abstract.stencils, like circle(3)
+    stencil = diamond(1)
+
     def __init__(self, letter, name, owner=None):
         """A class to represent items which can only affect its surroundings,
         both if carried by an owner of if it lies on the ground.
@@ -69,16 +80,20 @@ class ShortRangeItem(Item):
 
         May be None if the Item has no owner and it hasn't been put onto a
         map yet.
-        """
-        def only_valid_from(s): return list(filter(lambda t: t is not None, s))
 
-        if self.owner:
-            return only_valid_from(self.owner.surroundings.values())
-        else:
-            return only_valid_from(self.surroundings.values()) if self.home_tile else None
+        The tiles are the ones covered by the stencil of the item,
+        centered on its owner, or on the item if it has no owner.
+        """
+        center = self.owner if self.owner else self
+        if center is self and self.home_tile is None:
+            return None
+        x, y = center.position
+        return center.home_tile.board.tiles_in(self.stencil, x, y)
 
 
 class Character(Piece):
+    __slots__ = ('items', 'attack_damage', '_health')
+
     def __init__(self, letter, name, movements=None, attack_damage=1,
                  items=None, health=10):
         """A baseclass for all characters, be them the Player, NPCs or enemies.
@@ -92,7 +107,8 @@ class Character(Piece):
                 Pass an empty list to explictly set no movements for this Character.
             attack_damage (int): how much damage should this piece do when attacking
             items ([Items]): the Items this piece should start with.
-                If left None, items will be an empty list.
+                If left None, the character will start with no items.
+                They are kept on an :class:`~ludema.inventory.Inventory`.
             health (int): how much health should this character have.
 
         Warning:
@@ -103,11 +119,26 @@ class Character(Piece):
             :class:`~ludema.pieces.Player`. If you want an NPC,
             either friendly or unfriendly, use :class:`~ludema.pieces.NPC`.
         """
-        Piece.__init__(self, letter, name, movements)
-        self.items = items or []
+        Piece.__init__(self, letter, name, movements=movements)
+        self.items = Inventory(items)
         self.health = health
         self.attack_damage = attack_damage
 
+    @property
+    def health(self):
+        """How much health the character has left. When it drops to 0 or
+        less, however it happens, the character is taken out of its board
+        at the end of the turn. See :class:`~ludema.combat.Combat`.
+        """
+        return self._health
+
+    @health.setter
+    def health(self, health):
+        self._health = health
+        home_tile = self.home_tile
+        if home_tile is not None and self.is_dead:
+            home_tile.board.combat.hurt(self)
+
     @property
     def is_dead(self):
         """Return True if health is below 0, False otherwise."""
@@ -163,12 +194,26 @@ class Character(Piece):
         """
         pass
 
+    def catch_up(self, turns):
+        """This method will be called when the Character starts acting
+        again after being frozen for turns turns, far away from every player.
+        See :attr:`~ludema.board.Board.activity_radius`. Default behavior is
+        to do nothing, as if time had stopped for it. Override it to cheaply
+        make up for the turns it missed, like healing it all at once.
+
+        Args:
+            turns (int): how many turns the character didn't act
+        """
+        pass
+
     # TODO: implement
     def __do_active_action(self):
         pass
 
 
 class Player(Character):
+    __slots__ = ('turn_passing_actions', '_acting')
+
     def __init__(self, letter, name, movements=None, attack_damage=1, items=None,
                  health=10, turn_passing_actions=None):
         """The Player character. The most important characteristic of the Player
@@ -189,40 +234,98 @@ class Player(Character):
                 using one of these methods or using the Action.do method will
                 pass a turn on the character's board. If left on None,
                 moving, grabbing an item and attacking will pass a turn.
+                Actions look at this list only once, the first time
+                they are used. Whatever a method does, it passes a single
+                turn, even if it calls other turn passing methods or actions.
         """
+        self._acting = False  # True while doing something which passes a turn
         Character.__init__(self, letter, name, movements, attack_damage,
                            items, health)
         self.turn_passing_actions = turn_passing_actions or ['use_item', 'grab_item', 'move']
 
+    def __init_subclass__(cls, **kwargs):
+        """Let the methods defined by subclasses pass turns too."""
+        super().__init_subclass__(**kwargs)
+        _make_turn_passing(cls, vars(cls))
+
+    def _new_action(self, name, action_class, action_functions):
+        """Create the action interface, making its do method pass a turn
+        if the name of the interface is on self.turn_passing_actions.
+        """
+        action = Character._new_action(self, name, action_class, action_functions)
+        if name in self.turn_passing_actions:
+            action.do = self.__pass_turn(action.do)
+            action.passes_turn = True
+        return action
+
     def __pass_turn(self, func):
         """A decorator which makes a function pass a turn on the character's
         home board.
         """
         @wraps(func)
         def pass_wrapper(*args, **kwargs):
-            res = func(*args, **kwargs)
-            home_tile = object.__getattribute__(self, 'home_tile')
-            if home_tile is not None:
-                home_tile.board.turn += 1
-            else:
-                raise PieceIsNotOnATileError(self)
-            return res
+            return self._do_passing_turn(func, *args, **kwargs)
         return pass_wrapper
 
-    def __getattribute__(self, name):
-        """Overriden __getattribute__ so that it applies the __pass_turn
-        decorator to the methods or actions on self.turn_passing_actions.
+    def _do_passing_turn(self, func, *args, **kwargs):
+        """Call func and then pass a turn, unless the player was already
+        doing something which passes a turn: then that one passes it.
+        Overriden methods calling the ones they override, or items which
+        move the player, pass a single turn this way.
+
+        Returns:
+            whatever func returns
         """
-        attr = object.__getattribute__(self, name)
-        if name in object.__getattribute__(self, 'turn_passing_actions'):
-            if isinstance(attr, Action):
-                attr.do = self.__pass_turn(attr.do)
-            else:
-                attr = self.__pass_turn(attr)
-        return attr
+        if self._acting:
+            return func(*args, **kwargs)
+        self._acting = True
+        try:
+            res = func(*args, **kwargs)
+        finally:
+            self._acting = False
+        self._end_turn()
+        return res
+
+    def _end_turn(self):
+        """Pass a turn on the board the player lives in.
+
+        Raises:
+            PieceIsNotOnATileError: if the player is not on a board
+        """
+        if self.home_tile is None:
+            raise PieceIsNotOnATileError(self)
+        self.home_tile.board.turn += 1
+
+
+def _make_turn_passing(player_class, attributes):
+    """Replace the public methods among attributes, a {name: attribute}
+    dictionary of player_class, with ones which pass a turn if their name
+    is on the turn_passing_actions of the player. It's done once per
+    class, when it's created, on the methods it defines: the players only
+    have to look at their list when the methods are called.
+    """
+    for name, method in list(attributes.items()):
+        if name.startswith('_') or not inspect.isfunction(method):
+            continue
+        setattr(player_class, name, _turn_passing(name, method))
+
+
+def _turn_passing(name, method):
+    @wraps(method)
+    def turn_passing_method(self, *args, **kwargs):
+        if name in self.turn_passing_actions:
+            return self._do_passing_turn(method, self, *args, **kwargs)
+        return method(self, *args, **kwargs)
+    return turn_passing_method
+
+
+# the methods Player inherits have to pass turns too
+_make_turn_passing(Player, dict(inspect.getmembers(Player, inspect.isfunction)))
 
 
 class NPC(Character):
+    __slots__ = ()
+
     def __init__(self, letter, name, movements=None, attack_damage=1,
                  items=None, health=10):
         Character.__init__(self, letter, name, movements, attack_damage,
@@ -0,0 +1,156 @@
+import weakref
+from ludema.abstract.piece import Piece
+from ludema.inventory import Inventory
+from ludema.exceptions import ImpossibleToExtractPiece
+
+"""
+The purpose of this module is to make pieces cheap to create and to reuse.
+Instead of building every wall of a level from scratch, build one and clone it.
+"""
+
+_SLOTS = {}  # class -> the slot descriptors of its instances
+
+
+def _slots(class_):
+    """Return the descriptors of all the slots an instance of class_ may have.
+    We use them instead of the names of the slots because subclasses may
+    hide slots behind properties, like a Piece subclass with a letter property.
+    """
+    descriptors = _SLOTS.get(class_)
+    if descriptors is None:
+        descriptors = []
+        for klass in class_.__mro__:
+            slots = klass.__dict__.get('__slots__', ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            for slot in slots:
+                if slot in ('__dict__', '__weakref__'):
+                    continue
+                if slot.startswith('__') and not slot.endswith('__'):
+                    slot = '_{0}{1}'.format(klass.__name__.lstrip('_'), slot)
+                descriptors.append(klass.__dict__[slot])
+        _SLOTS[class_] = descriptors
+    return descriptors
+
+
+def _fresh(value):
+    """Containers must not be shared between a prototype and its clones."""
+    if isinstance(value, (list, dict, set, Inventory)):
+        return value.copy()
+    return value
+
+
+def _copy_state(source, target):
+    """Make target look exactly like source, but for its tile and its
+    action interfaces, which belong to each piece.
+    """
+    for slot in _slots(type(source)):
+        try:
+            value = slot.__get__(source)
+        except AttributeError:  # an empty slot
+            continue
+        slot.__set__(target, _fresh(value))
+    if hasattr(source, '__dict__'):
+        target.__dict__.clear()
+        target.__dict__.update((key, _fresh(value))
+                               for key, value in source.__dict__.items())
+    target.home_tile = None
+    target._move = target._attack = target._grab = None
+
+
+class PrototypeRegistry:
+    """Keeps one prototype for each kind of piece you register, and creates
+    new pieces by cloning them, which is way cheaper than calling their
+    constructors. Pieces you don't need anymore can be released back to
+    the registry, and will be reused by the next clones.
+
+    Example:
+        ::
+            prototypes = PrototypeRegistry()
+            prototypes.register('wall', lambda: Wall(letter=Style.DIM + "."))
+            legend = {'*': prototypes.factory('wall')}
+            board = Board.new_from_blueprint("First", level1, legend, ...)
+            # ... once you're done with the board
+            board.release_pieces(prototypes)
+
+    Note:
+        Clones are shallow: lists, dictionaries, sets and inventories are copied, but
+        the clones share everything else with their prototype. Pieces which
+        hold references to other specific pieces are not good prototypes.
+    """
+    def __init__(self):
+        self._prototypes = {}  # key -> prototype
+        self._pools = {}  # key -> [released pieces]
+        # piece created here -> key of its prototype. weak, so the clones
+        # which are dropped instead of released don't stay alive here
+        self._keys = weakref.WeakKeyDictionary()
+
+    def __contains__(self, key):
+        return key in self._prototypes
+
+    def register(self, key, prototype):
+        """Register a prototype under key.
+
+        Args:
+            key (hashable): how you'll refer to this kind of piece. A letter
+                of your blueprints is a good choice.
+            prototype (Piece | nullary function -> Piece): the piece to clone,
+                or a function which creates it. The function is called only once.
+
+        Returns:
+            Piece: the prototype
+
+        Raises:
+            ImpossibleToExtractPiece: if prototype is not a piece nor
+                returns one
+        """
+        piece = prototype() if callable(prototype) else prototype
+        if not isinstance(piece, Piece):
+            raise ImpossibleToExtractPiece(prototype)
+        self._prototypes[key] = piece
+        self._pools.setdefault(key, [])
+        return piece
+
+    def clone(self, key):
+        """Return a piece just like the prototype registered under key.
+        Released pieces are reused before creating new ones.
+
+        Raises:
+            KeyError: if there's no prototype registered under key
+        """
+        prototype = self._prototypes[key]
+        pool = self._pools[key]
+        if pool:
+            return pool.pop()
+        piece = object.__new__(type(prototype))
+        _copy_state(prototype, piece)
+        self._keys[piece] = key
+        return piece
+
+    def factory(self, key):
+        """Return a nullary function which clones the prototype registered
+        under key. Ideal for the legends of blueprints.
+        """
+        return lambda: self.clone(key)
+
+    def release(self, piece):
+        """Give back a piece created by this registry, so it can be reused.
+        The piece is removed from its board if it's on one, and left
+        exactly as its prototype. Don't use it after releasing it.
+
+        Returns:
+            bool: True if the piece was released, False if it wasn't
+            created by this registry
+        """
+        key = self._keys.get(piece)
+        if key is None:
+            return False
+        if piece.home_tile is not None:
+            piece.home_tile.board.remove_piece(piece)
+        _copy_state(self._prototypes[key], piece)
+        self._pools[key].append(piece)
+        return True
+
+    def pooled(self, key):
+        """Return how many released pieces are waiting to be reused for key."""
+        return len(self._pools.get(key, ()))
@@ -0,0 +1,111 @@
+import re
+from ludema.utils import piece_classes, discard_from_index
+
+"""
+The purpose of this module is to keep track of the pieces living on a board,
+so they can be found without looking at every tile of it.
+"""
+
+# pieces usually have colorama codes on their letters
+_ANSI_CODES = re.compile(r'\x1b\[[0-9;]*m')
+
+
+def plain_letter(letter):
+    """Return letter without the terminal color codes it may have."""
+    return _ANSI_CODES.sub('', letter)
+
+
+class PieceRegistry:
+    """Indexes the pieces on a board by id, name, class and letter.
+
+    Every piece put on the board is given an id, which will never change
+    nor be given to another piece while the piece is on the board.
+    All the lookups take constant time.
+
+    Note:
+        Boards manage their registry by themselves. You most probably
+        only want to query it.
+    """
+    def __init__(self):
+        self._next_id = 1
+        self._ids = {}  # piece -> id
+        # piece -> (name, letter) as they were when registered, as both may change
+        self._keys = {}
+        self._by_id = {}
+        # these map to ordered sets of pieces, see utils.discard_from_index
+        self._by_name = {}
+        self._by_class = {}
+        self._by_letter = {}
+
+    def __contains__(self, piece):
+        return piece in self._ids
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __iter__(self):
+        return iter(list(self._ids))
+
+    def add(self, piece):
+        """Register piece. Nothing happens if it was already registered.
+
+        Returns:
+            int: the id of the piece
+        """
+        if piece in self._ids:
+            return self._ids[piece]
+        id_ = self._next_id
+        self._next_id += 1
+        name, letter = piece.name, plain_letter(piece.letter)
+        self._ids[piece] = id_
+        self._keys[piece] = name, letter
+        self._by_id[id_] = piece
+        self._by_name.setdefault(name, {})[piece] = None
+        self._by_letter.setdefault(letter, {})[piece] = None
+        for class_ in piece_classes(piece):
+            self._by_class.setdefault(class_, {})[piece] = None
+        return id_
+
+    def remove(self, piece):
+        """Forget about piece. Nothing happens if it wasn't registered."""
+        id_ = self._ids.pop(piece, None)
+        if id_ is None:
+            return
+        del self._by_id[id_]
+        name, letter = self._keys.pop(piece)
+        discard_from_index(self._by_name, name, piece)
+        discard_from_index(self._by_letter, letter, piece)
+        for class_ in piece_classes(piece):
+            discard_from_index(self._by_class, class_, piece)
+
+    def id_of(self, piece):
+        """Return the id of piece, or None if it isn't registered."""
+        return self._ids.get(piece)
+
+    def by_id(self, id_):
+        """Return the piece with the id given, or None if there's no such piece."""
+        return self._by_id.get(id_)
+
+    def named(self, name):
+        """Return the piece with the name given, or None if there's no such piece.
+        If several pieces share the name, the first one registered is returned.
+        """
+        pieces = self._by_name.get(name)
+        return next(iter(pieces)) if pieces else None
+
+    def all_named(self, name):
+        """Return a read-only view of all the pieces with the name given."""
+        return self._by_name.get(name, {}).keys()
+
+    def of_type(self, class_):
+        """Return a read-only view of all the pieces which are instances of class_,
+        subclasses included. Make a list out of it if you plan to add or remove
+        pieces while iterating over it.
+        """
+        return self._by_class.get(class_, {}).keys()
+
+    def with_letter(self, letter):
+        """Return a read-only view of all the pieces represented by letter.
+        Color codes on the letters are ignored.
+        """
+        return self._by_letter.get(plain_letter(letter), {}).keys()
@@ -0,0 +1,251 @@
+import heapq
+from fractions import Fraction
+from numbers import Real
+
+"""
+The purpose of this module is to decide which characters act when a turn
+passes, so boards full of sleeping monsters only pay for the awake ones.
+"""
+
+# what turns are split into. divisible by every number up to 16, so the
+# waits of most speeds are a whole number of units
+_UNITS = 720720
+
+
+class Scheduler:
+    """Keeps the characters of a board on a heap, ordered by the time they
+    will act next. Passing a turn only looks at the characters whose time
+    has come.
+
+    Time is measured in turns. A character with speed 1 acts once per turn,
+    one with speed 2 twice, and one with speed 0.5 every other turn.
+    Every time a character acts it spends energy: if its do_passive_action
+    returns a number, that's the energy it spent, otherwise it spent
+    scheduler.default_cost. The more energy spent, the longer it takes for
+    the character to act again: cost / speed turns.
+
+    Characters may be put to sleep. Sleeping characters don't act and cost
+    nothing until woken up. Characters may also be frozen, which is the
+    same but for the scheduler remembering since when: boards freeze the
+    characters far away from the players, see Board.activity_radius.
+    Both are independent: characters only act if they are neither
+    sleeping nor frozen.
+
+    When several characters act at the same time, NPCs act before Players,
+    and each in the order they were put on the board.
+
+    Times are kept exact: in whole units of a turn, carrying what's left
+    of each wait over to the next one. A character with speed 3 acts
+    exactly three times every turn, however long the game goes on.
+    Speeds given as floats are taken as the nearest fraction with a
+    denominator of at most a million: 0.1 is taken as 1/10.
+
+    Note:
+        Boards add the characters put on them to their scheduler, and take
+        out the ones removed, by themselves.
+    """
+    def __init__(self, default_cost=1):
+        """
+        Args:
+            default_cost (number): the energy spent by an action which
+                doesn't say how much it cost
+        """
+        self.default_cost = default_cost
+        self.now = 0  # the last turn which passed
+        self._heap = []  # [time in units, group, order, character or None if forgotten]
+        self._entries = {}  # character -> its entry on the heap
+        self._speeds = {}  # character -> speed, for all characters, asleep or not
+        # character -> the remainder of its last wait, in 1 / speed.numerator units
+        self._carries = {}
+        self._orders = {}  # character -> order in which it was added
+        self._next_order = 0
+        self._sleeping = {}  # character -> None, an ordered set
+        self._frozen = {}  # character -> the turn it was frozen on
+        self._forgotten = 0  # how many entries on the heap were forgotten
+
+    def __contains__(self, character):
+        return character in self._speeds
+
+    def __len__(self):
+        """How many characters are awake."""
+        return len(self._entries)
+
+    def add(self, character, speed=1, group=0):
+        """Start scheduling character. It will act for the first time
+        1 / speed turns from now. Nothing happens if it was already added.
+
+        Args:
+            character (Character): anything with a do_passive_action method
+            speed (number): how many times it acts per turn
+            group (int): characters with lower groups act first when
+                they act at the same time
+        """
+        if character in self._speeds:
+            return
+        self._speeds[character] = self._check_speed(speed)
+        self._carries[character] = 0
+        self._orders[character] = (group, self._next_order)
+        self._next_order += 1
+        self.__schedule(character, self.now * _UNITS + self.__wait(character, _UNITS))
+
+    def remove(self, character):
+        """Stop scheduling character. Nothing happens if it wasn't added."""
+        if self._speeds.pop(character, None) is None:
+            return
+        del self._orders[character]
+        del self._carries[character]
+        self._sleeping.pop(character, None)
+        self._frozen.pop(character, None)
+        self.__forget(character)
+
+    def speed_of(self, character):
+        """Return the speed of character, as an int or a Fraction."""
+        return self._speeds[character]
+
+    def set_speed(self, character, speed):
+        """Change the speed of character. It takes effect the next time
+        it acts.
+        """
+        if character not in self._speeds:
+            raise KeyError(character)
+        self._speeds[character] = self._check_speed(speed)
+        self._carries[character] = 0
+
+    def sleep(self, character):
+        """Put character to sleep: it won't act until woken up."""
+        if character not in self._speeds or character in self._sleeping:
+            return
+        self._sleeping[character] = None
+        self.__forget(character)
+
+    def wake(self, character, turns=1):
+        """Wake character up, so it acts turns turns from now. If it's
+        frozen too, it won't act until thawed. Nothing happens if it
+        wasn't asleep.
+        """
+        if character not in self._sleeping:
+            return
+        del self._sleeping[character]
+        if character not in self._frozen:
+            self.__schedule(character, (self.now + turns) * _UNITS)
+
+    def is_asleep(self, character):
+        """Return True if character is sleeping."""
+        return character in self._sleeping
+
+    @property
+    def sleeping(self):
+        """A read-only view of the sleeping characters."""
+        return self._sleeping.keys()
+
+    def freeze(self, character):
+        """Stop character from acting until thawed. Sleeping characters
+        can be frozen too: if woken up while frozen, they still don't act
+        until thawed. Nothing happens if it was already frozen.
+        """
+        if character not in self._speeds or character in self._frozen:
+            return
+        self.__forget(character)
+        self._frozen[character] = self.now
+
+    def thaw(self, character):
+        """Let a frozen character act again, 1 / speed turns from now,
+        or whenever it's woken up if it's sleeping.
+
+        Returns:
+            int: how many turns the character was frozen. 0 if it wasn't.
+        """
+        since = self._frozen.pop(character, None)
+        if since is None:
+            return 0
+        if character not in self._sleeping:
+            self.__schedule(character, self.now * _UNITS + self.__wait(character, _UNITS))
+        return self.now - since
+
+    def is_frozen(self, character):
+        """Return True if character is frozen."""
+        return character in self._frozen
+
+    @property
+    def frozen(self):
+        """A read-only view of the frozen characters."""
+        return self._frozen.keys()
+
+    def tick(self, act=None):
+        """Pass a turn: let all the characters whose time has come act,
+        in order, as many times as their speed lets them.
+
+        Args:
+            act (function: Character -> anything | None): how to make
+                a character act. None to call its do_passive_action.
+                Whatever it returns is taken as the energy spent.
+
+        Returns:
+            int: how many actions were made
+        """
+        self.now += 1
+        now = self.now * _UNITS
+        actions = 0
+        # the heap may be rebuilt while the characters act, don't keep it around
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            character = entry[3]
+            if character is None:  # forgotten while on the heap
+                self._forgotten -= 1
+                continue
+            del self._entries[character]
+            cost = act(character) if act else character.do_passive_action()
+            actions += 1
+            if isinstance(cost, bool) or not isinstance(cost, Real) or cost <= 0:
+                cost = self.default_cost
+            # the character may have been removed, put to sleep or frozen while acting
+            if character in self._speeds and character not in self._sleeping:
+                if character not in self._entries and character not in self._frozen:
+                    units = cost * _UNITS if isinstance(cost, int) else max(1, round(cost * _UNITS))
+                    self.__schedule(character, entry[0] + self.__wait(character, units))
+        return actions
+
+    @staticmethod
+    def _check_speed(speed):
+        """Return speed as an int, or as a Fraction if it isn't whole.
+
+        Raises:
+            ValueError: if speed is not greater than 0
+        """
+        if speed <= 0:
+            raise ValueError("Speed must be greater than 0.")
+        if isinstance(speed, int):
+            return speed
+        speed = Fraction(speed).limit_denominator(1000000)
+        return speed.numerator if speed.denominator == 1 else speed
+
+    def __wait(self, character, units):
+        """Return how many units character has to wait after spending units
+        units of energy, carrying what's left over to its next wait.
+        """
+        speed = self._speeds[character]
+        if speed == 1:
+            return units
+        # ints have a numerator and a denominator too
+        wait, self._carries[character] = divmod(
+            units * speed.denominator + self._carries[character], speed.numerator)
+        return wait
+
+    def __schedule(self, character, time):
+        self.__forget(character)
+        entry = [time, *self._orders[character], character]
+        self._entries[character] = entry
+        heapq.heappush(self._heap, entry)
+
+    def __forget(self, character):
+        # entries can't be taken out of the middle of a heap: mark them, and
+        # skip them when they come out
+        entry = self._entries.pop(character, None)
+        if entry is not None:
+            entry[3] = None
+            self._forgotten += 1
+            # don't let the heap fill up with the entries of sleeping characters
+            if self._forgotten > 64 and self._forgotten > len(self._entries):
+                self._heap = [entry for entry in self._heap if entry[3] is not None]
+                heapq.heapify(self._heap)
+                self._forgotten = 0
@@ -0,0 +1,164 @@
+import heapq
+import math
+from ludema.abstract.piece import Piece
+from ludema.utils import piece_classes, discard_from_index
+
+"""
+The purpose of this module is to answer questions like 'which players
+are less than 10 tiles away from here?' without looking at every tile
+of the board.
+"""
+
+
+class SpatialHash:
+    """Groups the pieces of a board on square buckets of cell_size x cell_size
+    positions, one set of buckets for each class of piece. Looking for pieces
+    around a position only needs to look at the buckets around it.
+
+    Note:
+        Boards manage their spatial hash by themselves, updating it every
+        time a piece is put, removed or moved. You most probably only want
+        to query it.
+    """
+    def __init__(self, cell_size=8):
+        """
+        Args:
+            cell_size (int): the width and height of each bucket
+        """
+        self.cell_size = cell_size
+        self._cells = {}  # piece -> the (cell_x, cell_y) of its bucket
+        self._classes = {}  # piece -> the classes it is indexed as
+        # piece class -> {(cell_x, cell_y): {piece: None}}
+        self._buckets = {}
+        self._counts = {}  # piece class -> how many pieces of it there are
+
+    def __contains__(self, piece):
+        return piece in self._cells
+
+    def __len__(self):
+        return len(self._cells)
+
+    def _cell_of(self, x, y):
+        return x // self.cell_size, y // self.cell_size
+
+    def add(self, piece, x, y):
+        """Index piece as being on position x, y."""
+        if piece in self._cells:
+            return self.move(piece, x, y)
+        cell = self._cell_of(x, y)
+        classes = piece_classes(piece)
+        self._cells[piece] = cell
+        self._classes[piece] = classes
+        for class_ in classes:
+            self._buckets.setdefault(class_, {}).setdefault(cell, {})[piece] = None
+            self._counts[class_] = self._counts.get(class_, 0) + 1
+
+    def remove(self, piece):
+        """Stop indexing piece. Nothing happens if it wasn't indexed."""
+        cell = self._cells.pop(piece, None)
+        if cell is None:
+            return
+        for class_ in self._classes.pop(piece):
+            discard_from_index(self._buckets[class_], cell, piece)
+            self._counts[class_] -= 1
+
+    def move(self, piece, x, y):
+        """Let the index know that piece is now on position x, y."""
+        old_cell = self._cells.get(piece)
+        if old_cell is None:
+            return self.add(piece, x, y)
+        new_cell = self._cell_of(x, y)
+        if new_cell == old_cell:
+            return
+        self._cells[piece] = new_cell
+        for class_ in self._classes[piece]:
+            discard_from_index(self._buckets[class_], old_cell, piece)
+            self._buckets[class_].setdefault(new_cell, {})[piece] = None
+
+    def within(self, x, y, radius, piece_class=Piece):
+        """Return a list with all the pieces of piece_class which are
+        at most radius positions away from x, y, as the crow flies.
+
+        Args:
+            x (int): the x coordinate of the center
+            y (int): the y coordinate of the center
+            radius (int | float): the maximum distance to the center
+            piece_class (type): only look for pieces of this class
+
+        Returns:
+            [Piece]: the pieces found, in no particular order
+        """
+        buckets = self._buckets.get(piece_class)
+        if not buckets:
+            return []
+        min_x, min_y = self._cell_of(math.floor(x - radius), math.floor(y - radius))
+        max_x, max_y = self._cell_of(math.ceil(x + radius), math.ceil(y + radius))
+        found = []
+        squared_radius = radius * radius
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                for piece in buckets.get((cell_x, cell_y), ()):
+                    position = piece.position
+                    if (position.x - x) ** 2 + (position.y - y) ** 2 <= squared_radius:
+                        found.append(piece)
+        return found
+
+    def nearest(self, x, y, k=1, piece_class=Piece, max_radius=None):
+        """Return a list with the k pieces of piece_class nearest to x, y,
+        as the crow flies, closest first.
+
+        Args:
+            x (int): the x coordinate of the center
+            y (int): the y coordinate of the center
+            k (int): how many pieces to look for
+            piece_class (type): only look for pieces of this class
+            max_radius (int | float | None): ignore pieces further away than
+                this. None means no limit.
+
+        Returns:
+            [Piece]: up to k pieces. Fewer if there aren't enough of them.
+        """
+        buckets = self._buckets.get(piece_class)
+        total = self._counts.get(piece_class, 0)
+        if not buckets or not total or k <= 0:
+            return []
+
+        center_x, center_y = self._cell_of(x, y)
+        candidates = []  # (squared distance, tie breaker, piece)
+        seen = 0
+        ring = 0
+        while True:
+            for cell in self.__ring(center_x, center_y, ring):
+                for piece in buckets.get(cell, ()):
+                    seen += 1
+                    position = piece.position
+                    distance = (position.x - x) ** 2 + (position.y - y) ** 2
+                    candidates.append((distance, seen, piece))
+            # every piece outside the rings we've looked at is at least
+            # ring * cell_size positions away
+            covered = ring * self.cell_size
+            if len(candidates) >= k:
+                kth_distance = heapq.nsmallest(k, candidates)[-1][0]
+                if kth_distance <= covered * covered:
+                    break
+            if seen == total or (max_radius is not None and covered > max_radius):
+                break
+            ring += 1
+
+        nearest = heapq.nsmallest(k, candidates)
+        if max_radius is not None:
+            nearest = [c for c in nearest if c[0] <= max_radius * max_radius]
+        return [piece for _, _, piece in nearest]
+
+    @staticmethod
+    def __ring(center_x, center_y, ring):
+        """Yield the cells exactly ring cells away from the center cell."""
+        if ring == 0:
+            yield center_x, center_y
+            return
+        for cell_x in range(center_x - ring, center_x + ring + 1):
+            yield cell_x, center_y - ring
+            yield cell_x, center_y + ring
+        for cell_y in range(center_y - ring + 1, center_y + ring):
+            yield center_x - ring, cell_y
+            yield center_x + ring, cell_y
@@ -0,0 +1,133 @@
+"""
+The purpose of this module is to run things some turns from now, or every
+some turns, like poison ticking or doors closing by themselves, without
+the pieces involved having to check on every turn whether their time came.
+"""
+
+
+class Timer:
+    """Something to be done on a given turn, as returned by
+    :func:`~ludema.timers.TimerWheel.schedule`. Keep it around to
+    cancel it.
+    """
+    __slots__ = ('turn', 'callback', 'every', '_wheel')
+
+    def __init__(self, turn, callback, every, wheel):
+        self.turn = turn  # the turn it's due on
+        self.callback = callback
+        self.every = every
+        self._wheel = wheel  # None once cancelled or done
+
+    def __repr__(self):
+        return "Timer(turn={0}, callback={1}, every={2})".format(
+            self.turn, self.callback, self.every)
+
+    @property
+    def pending(self):
+        """True if the timer will still fire: it hasn't been cancelled,
+        and it's either recurring or its turn hasn't come yet.
+        """
+        return self._wheel is not None
+
+    def cancel(self):
+        """Make sure the timer won't fire again. Nothing happens if it was
+        already cancelled or done.
+        """
+        if self._wheel is not None:
+            self._wheel.cancel(self)
+
+
+class TimerWheel:
+    """Keeps timers in slots indexed by the turn they're due on, so passing
+    a turn only looks at the timers of that turn: thousands of timers
+    waiting for later turns cost nothing.
+
+    Timers due on the same turn fire in the order they were scheduled.
+
+    Note:
+        Boards create their wheel by themselves, and tick it every time a
+        turn passes. Use :func:`~ludema.board.Board.schedule` to add timers.
+    """
+    def __init__(self):
+        self.now = 0  # the last turn which passed
+        self._slots = {}  # turn -> {timer: None}, an ordered set
+        self._count = 0
+
+    def __len__(self):
+        """How many timers are pending."""
+        return self._count
+
+    def __contains__(self, timer):
+        return timer._wheel is self
+
+    def schedule(self, turns, callback, every=None):
+        """Call callback turns turns from now, and then every every turns,
+        if every is not None, until cancelled.
+
+        Args:
+            turns (int): how many turns from now it should be called. At least 1.
+            callback (nullary function): what to call
+            every (int | None): how often to call it again afterwards.
+                At least 1. None to call it just once.
+
+        Returns:
+            Timer: the timer, which can be cancelled
+
+        Raises:
+            ValueError: if turns or every are less than 1
+        """
+        if turns < 1:
+            raise ValueError("Timers can only be scheduled for future turns.")
+        if every is not None and every < 1:
+            raise ValueError("Recurring timers must wait at least one turn.")
+        timer = Timer(self.now + turns, callback, every, self)
+        self.__add(timer)
+        return timer
+
+    def cancel(self, timer):
+        """Make sure timer won't fire again. Nothing happens if it was
+        already cancelled or done, or if it belongs to another wheel.
+        """
+        if timer._wheel is not self:
+            return
+        timer._wheel = None
+        self._count -= 1
+        # the slot isn't there if the timer is being fired right now
+        slot = self._slots.get(timer.turn)
+        if slot is not None:
+            slot.pop(timer, None)
+            if not slot:
+                del self._slots[timer.turn]
+
+    def tick(self):
+        """Pass a turn: fire the timers due on it, and schedule again the
+        recurring ones.
+
+        Returns:
+            int: how many timers fired
+        """
+        self.now += 1
+        slot = self._slots.pop(self.now, None)
+        if slot is None:
+            return 0
+        fired = 0
+        for timer in slot:
+            # a callback may cancel the timers after it
+            if timer._wheel is not self:
+                continue
+            timer.callback()
+            fired += 1
+            # or its own timer
+            if timer._wheel is not self:
+                continue
+            if timer.every is None:
+                timer._wheel = None
+                self._count -= 1
+            else:
+                timer.turn = self.now + timer.every
+                self._slots.setdefault(timer.turn, {})[timer] = None
+        return fired
+
+    def __add(self, timer):
+        self._slots.setdefault(timer.turn, {})[timer] = None
+        self._count += 1
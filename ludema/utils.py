@@ -45,3 +45,33 @@ def extract_pieces_from_possible_containers(container):
     if not isinstance(piece, Piece):
         raise exceptions.ImpossibleToExtractPiece(container)
     return piece
+
+def piece_classes(piece):
+    """
+    Args:
+        piece (Piece): just any piece.
+
+    Returns:
+        [type]: the classes of piece which are Piece or subclasses of it,
+        from the most specific to Piece itself.
+    """
+    return [class_ for class_ in type(piece).__mro__
+            if isinstance(class_, type) and issubclass(class_, Piece)]
+
+def discard_from_index(index, key, value):
+    """Take value out of index[key], and key out of index if nothing is left.
+    Indexes are dictionaries mapping each key to the values under it, kept
+    on a dictionary used as an ordered set: {value: None}. Nothing happens
+    if value wasn't there.
+
+    Args:
+        index ({key: {value: None}}): the index
+        key (hashable): where value is
+        value (hashable): what to take out
+    """
+    values = index.get(key)
+    if values is None:
+        return
+    values.pop(value, None)
+    if not values:
+        del index[key]
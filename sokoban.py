@@ -36,28 +36,16 @@ def control_guy():
 # to easily define our own pieces
 class Box(Piece):
     def __init__(self, possible_destinations):
-        Piece.__init__(self, letter=(Fore.YELLOW + "\u25A1"))
+        # pushable pieces are pushed when another piece moves into them,
+        # exactly what we want for our boxes: when guy pushes to any
+        # direction, the box (and any box behind it) moves in that direction too.
+        Piece.__init__(self, letter=(Fore.YELLOW + "\u25A1"), pushable=True)
         self.possible_destinations = possible_destinations
 
     @property
     def in_position(self):
         return self.position in [destination.position for destination in self.possible_destinations]
 
-    # the following is probably the most complicated piece of code on this game
-    # for someone new to python or coding to understand
-    # on_touch_do is a Piece function which is called every time another piece
-    # (the touching_piece) collisions with this one.
-    # for Sokoban, we want to do this: when guy pushes to any direction,
-    # make the box move in that direction too.
-    # so we access the touching_piece last movement,
-    # and then we use getattr to call that same movement on the box.
-    # we need to call getattr because move.history is just a list of strings
-    # like ['up', 'up', 'right', 'left', 'down']. Python allows us
-    # to access attributes via strings with getattr.
-    def on_touch_do(self, touching_piece):
-        touching_piece_last_movement = touching_piece.move.history[-1]
-        return getattr(self.move, touching_piece_last_movement)()
-
 # the destinations are easier. they just need to be marked, and we need
 # to specify that they are 'walkable', that is: the player (or any other piece)
 # can be placed above them.
@@ -98,14 +86,19 @@ level1 = """
 """
 
 # and this the leyend
-leyend = {'*': wall,
-           '@': guy,
+leyend = {'@': guy,
            'X': boxes,
            'O': boxes_dest
            }
 
+# walls never move nor do anything, so instead of creating a Wall for each
+# '*' we put a single one on the terrain layer of the board and let all
+# the '*' share it
+terrain = {'*': wall()}
+
 #ludema takes care of everything else
-board = Board.new_from_blueprint("First", level1, leyend, win_conditions, lose_conditions)
+board = Board.new_from_blueprint("First", level1, leyend, win_conditions, lose_conditions,
+                                 terrain=terrain)
 
 def on_won():
     print("WON!")